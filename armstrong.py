@@ -0,0 +1,130 @@
+"""
+Armstrong (narcissistic) numbers: n-digit numbers equal to the sum of their digits' n-th powers.
+
+    python armstrong.py --max-length 39 --processes 8
+
+The sum only depends on which digits occur, not their order, so the search walks digit
+multisets (counts of 9s, then 8s, ... then 0s) instead of numbers, adding c * d**n from a
+precomputed table as it goes. Every partial choice bounds the final sum to a range; a branch
+is cut when that range has no n-digit numbers, or when the leading digits shared by both
+ends of the range need more of some digit than the multiset can still supply.
+"""
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+MAX_LENGTH = 39  # No Armstrong number has more than 39 digits (60 * 9**60 < 10**59 bounds it)
+
+
+def armstrong_sum(n):
+    """Sum of the digits of n, each raised to the number of digits."""
+    digits = str(n)
+    power = len(digits)
+    return sum(int(d) ** power for d in digits)
+
+
+def is_armstrong(n):
+    return n >= 0 and armstrong_sum(n) == n
+
+
+def armstrong_sum_array(values):
+    """
+    Elementwise armstrong_sum over an int array of values in [0, 10**18), where every digit
+    power sum still fits in int64. Works digit position by digit position over the whole array.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    if values.size and (values.min() < 0 or values.max() >= 10**18):
+        raise ValueError("values must be within [0, 10**18); use is_armstrong for larger ints")
+    powers_of_ten = 10 ** np.arange(1, 19, dtype=np.int64)
+    lengths = np.searchsorted(powers_of_ten, values, side="right") + 1
+    table = np.arange(10, dtype=np.int64)[:, None] ** np.arange(19, dtype=np.int64)[None, :]
+    total = np.zeros_like(values)
+    rest = values.copy()
+    for _ in range(18):
+        total += table[rest % 10, lengths]
+        rest //= 10
+    return total
+
+
+def is_armstrong_array(values):
+    """Elementwise is_armstrong over an int array of values in [0, 10**18)."""
+    values = np.asarray(values, dtype=np.int64)
+    return armstrong_sum_array(values) == values
+
+
+def armstrong_numbers(length):
+    """Every positive Armstrong number with exactly `length` digits, ascending."""
+    low, high = 10 ** (length - 1), 10 ** length
+    powers = [d ** length for d in range(10)]
+    counts = [0] * 10
+    found = []
+
+    def feasible(lo, hi, digit, remaining):
+        # Leading digits common to every sum in [lo, hi] must come from the multiset: the
+        # counts of `digit`..9 are final, and only `remaining` digits below `digit` are left.
+        a, b = str(lo).zfill(length), str(hi).zfill(length)
+        prefix = 0
+        while prefix < length and a[prefix] == b[prefix]:
+            prefix += 1
+        if not prefix:
+            return True
+        used = [0] * 10
+        for ch in a[:prefix]:
+            used[ord(ch) - 48] += 1
+        if sum(used[:digit]) > remaining:
+            return False
+        return all(used[d] <= counts[d] for d in range(digit, 10))
+
+    def search(digit, remaining, total):
+        if digit == 0 or remaining == 0:
+            counts[0] = remaining
+            if low <= total < high and sorted(str(total).zfill(length)) == sorted(
+                    "".join(str(d) * counts[d] for d in range(10))):
+                found.append(total)
+            counts[0] = 0
+            return
+        step = powers[digit]
+        for c in range(remaining, -1, -1):
+            counts[digit] = c
+            subtotal = total + c * step
+            left = remaining - c
+            hi = subtotal + left * powers[digit - 1]
+            if hi < low or subtotal >= high:
+                continue
+            if feasible(subtotal, min(hi, high - 1), digit, left):
+                search(digit - 1, left, subtotal)
+        counts[digit] = 0
+
+    search(9, length, 0)
+    return sorted(found)
+
+
+def find_all(max_length=MAX_LENGTH, processes=None):
+    """Every Armstrong number up to max_length digits; lengths are searched in parallel processes."""
+    lengths = list(range(max_length, 0, -1))  # longest (slowest) first, so the pool stays busy
+    if processes == 1:
+        results = map(armstrong_numbers, lengths)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(armstrong_numbers, lengths))
+    return sorted(n for numbers in results for n in numbers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-length", type=int, default=MAX_LENGTH)
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    numbers = find_all(args.max_length, args.processes)
+    for n in numbers:
+        print(n)
+    print(f"{len(numbers)} Armstrong numbers with up to {args.max_length} digits "
+          f"in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,11 @@
+from armstrong import armstrong_sum, armstrong_sum_array
+
 def armstrong_num(num):
-    num_len = str(num)
-    digits = len(num_len)
-    total = 0
-    num_copy = num
-    for i in range(1, digits+1):
-        new_num = num%10
-        result = new_num**digits
-        num//=10
-        total+=result
+    if 0 <= num < 10**18:
+        total = int(armstrong_sum_array([num])[0])  # the batch path, for a batch of one
+    else:
+        total = armstrong_sum(num)  # beyond int64: exact Python ints
     print(total)
-    return total==num_copy
+    return total==num
 
 print(armstrong_num(153))
\ No newline at end of file
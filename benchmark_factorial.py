@@ -0,0 +1,62 @@
+"""
+Benchmark of factorials against factorial.py's recursion and math.factorial.
+
+    python benchmark_factorial.py --max-exponent 6
+
+For n = 10, 100, ... 10**max_exponent, times the old recursive factorial, a plain
+multiply-by-one-more loop, factorials.factorial (binary splitting, cold and memoized) and
+math.factorial, and checks the results agree.
+"""
+import argparse
+import math
+import time
+
+import factorials
+
+LOOP_LIMIT = 10**5  # The one-step loop is quadratic; larger n are skipped
+
+
+def recursive_factorial(num):
+    """factorial.py before the factorials module."""
+    if num == 0 or num == 1:
+        return 1
+    return num * recursive_factorial(num - 1)
+
+
+def loop_factorial(num):
+    result = 1
+    for k in range(2, num + 1):
+        result *= k
+    return result
+
+
+def time_call(func, n):
+    start = time.perf_counter()
+    try:
+        result = func(n)
+    except RecursionError:
+        return None, "RecursionError"
+    return result, f"{time.perf_counter() - start:10.4f}s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-exponent", type=int, default=6)
+    args = parser.parse_args()
+
+    print(f"{'n':>9} {'recursive':>15} {'loop':>15} {'binary split':>15} {'memoized':>15} {'math':>15}")
+    for exponent in range(1, args.max_exponent + 1):
+        n = 10 ** exponent
+        factorials._large_factorial.cache_clear()
+        old, old_text = time_call(recursive_factorial, n)
+        loop, loop_text = time_call(loop_factorial, n) if n <= LOOP_LIMIT else (None, "skipped")
+        new, new_text = time_call(factorials.factorial, n)
+        _, memo_text = time_call(factorials.factorial, n)
+        reference, math_text = time_call(math.factorial, n)
+        agree = all(r is None or r == reference for r in (old, loop, new))
+        print(f"{n:>9} {old_text:>15} {loop_text:>15} {new_text:>15} {memo_text:>15} {math_text:>15}"
+              f"  {'identical' if agree else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark of gcd_lcm against the functions it replaced.
+
+    python benchmark_gcd.py --pairs 1000000
+
+For inputs of growing size, times the old subtractive euclidean_gcd, the candidate loop in
+find_hcf and the increment loop in find_lcm against gcd_lcm.gcd / lcm, then compares a
+Python loop over --pairs random pairs with the NumPy elementwise path.
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+import gcd_lcm
+
+OLD_LIMIT = 2.0  # Seconds an old function may take before larger sizes are skipped
+
+
+def subtractive_gcd(a, b):
+    """euclidean_gcd.py before gcd_lcm: one recursion per subtraction."""
+    if a == 0:
+        return b
+    if b == 0:
+        return a
+    if a == b:
+        return a
+    if a > b:
+        return subtractive_gcd(a - b, b)
+    return subtractive_gcd(a, b - a)
+
+
+def candidate_hcf(a, b):
+    """find_hcf.py before gcd_lcm: tries every candidate up to min(a, b)."""
+    hcf_num = 1
+    for i in range(1, min(a, b) + 1):
+        if a % i == 0 and b % i == 0:
+            hcf_num = i
+    return hcf_num
+
+
+def increment_lcm(a, b):
+    """find_lcm.py before gcd_lcm: counts up from max(a, b) to the first common multiple."""
+    greater = max(a, b)
+    while greater % a or greater % b:
+        greater += 1
+    return greater
+
+
+def time_call(func, *args):
+    start = time.perf_counter()
+    try:
+        func(*args)
+    except RecursionError:
+        return None
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=10**6, help="random pairs for the array comparison")
+    args = parser.parse_args()
+
+    cases = (
+        ("euclidean_gcd(n, 1)", subtractive_gcd, gcd_lcm.gcd, lambda n: (n, 1)),
+        ("find_hcf(n, n - 1)", candidate_hcf, gcd_lcm.gcd, lambda n: (n, n - 1)),
+        ("find_lcm(n, n - 1)", increment_lcm, gcd_lcm.lcm, lambda n: (n, n - 1)),
+    )
+    print(f"recursion limit {sys.getrecursionlimit()}")
+    for label, old, new, make_args in cases:
+        print(f"\n--- {label} ---")
+        skip = False
+        for exponent in range(2, 10):
+            n = 10 ** exponent
+            pair = make_args(n)
+            old_seconds = None if skip else time_call(old, *pair)
+            new_seconds = time_call(new, *pair)
+            if skip:
+                old_text = "skipped"
+            elif old_seconds is None:
+                old_text, skip = "RecursionError", True
+            else:
+                old_text, skip = f"{old_seconds * 1e3:10.3f}ms", old_seconds > OLD_LIMIT
+            print(f"n = 1e{exponent}:  old {old_text:>14}   gcd_lcm {new_seconds * 1e6:8.2f}us")
+
+    print(f"\n--- {args.pairs:,} random pairs below 1e9 ---")
+    rng = np.random.default_rng(0)
+    a, b = rng.integers(1, 10**9, args.pairs), rng.integers(1, 10**9, args.pairs)
+    start = time.perf_counter()
+    loop = [gcd_lcm.gcd(x, y) for x, y in zip(a.tolist(), b.tolist())]
+    loop_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    vectorized = gcd_lcm.gcd_array(a, b)
+    array_seconds = time.perf_counter() - start
+    print(f"Python loop of gcd   {loop_seconds:8.3f}s")
+    print(f"gcd_array (NumPy)    {array_seconds:8.3f}s  {'identical' if loop == vectorized.tolist() else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
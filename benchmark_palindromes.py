@@ -0,0 +1,85 @@
+"""
+Benchmark of the palindromes module against palindrome_string.py's two-pointer loop.
+
+    python benchmark_palindromes.py --lines 1000000 --length 20000
+
+Checks --lines random short lines (a third of them palindromes) with the old two-pointer
+loop, with slice comparison and with palindrome_mask, then finds the longest palindromic
+substring of a random --length string of long letter runs by expanding around every centre (O(n^2)) and with
+Manacher's algorithm, and checks the answers agree.
+"""
+import argparse
+import random
+import time
+
+import palindromes
+
+
+def two_pointer(s):
+    """palindrome_string.py before the palindromes module."""
+    i, j = 0, len(s) - 1
+    while i < j:
+        if s[i] != s[j]:
+            return False
+        i += 1
+        j -= 1
+    return True
+
+
+def expand_longest(s):
+    """Longest palindromic substring by growing a palindrome from each of the 2n - 1 centres."""
+    best = s[:1]
+    for center in range(2 * len(s) - 1):
+        lo, hi = center // 2, (center + 1) // 2
+        while lo >= 0 and hi < len(s) and s[lo] == s[hi]:
+            lo -= 1
+            hi += 1
+        if hi - lo - 1 > len(best):
+            best = s[lo + 1:hi]
+    return best
+
+
+def random_lines(count, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        half = "".join(rng.choices("abc", k=rng.randint(1, 12)))
+        lines.append(half + half[::-1] if rng.random() < 1 / 3 else half + "".join(rng.choices("abc", k=len(half))))
+    return lines
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--length", type=int, default=20_000)
+    args = parser.parse_args()
+
+    lines = random_lines(args.lines)
+    old, old_time = timed(lambda: [two_pointer(s) for s in lines])
+    new, new_time = timed(lambda: list(palindromes.check_lines(lines)))
+    mask, mask_time = timed(palindromes.palindrome_mask, lines)
+    agree = old == new == mask.tolist()
+    print(f"{args.lines:,} lines, {sum(new):,} palindromes ({'identical' if agree else 'MISMATCH'})")
+    print(f"  two-pointer loop  {old_time:8.3f}s")
+    print(f"  slice comparison  {new_time:8.3f}s")
+    print(f"  palindrome_mask   {mask_time:8.3f}s")
+
+    rng = random.Random(1)
+    # Long runs of one letter: the worst case for expanding, where every centre grows far.
+    text = "".join(rng.choices("ab", weights=(999, 1), k=args.length))
+    old, old_time = timed(expand_longest, text)
+    new, new_time = timed(palindromes.longest_palindrome, text)
+    agree = len(old) == len(new) and new == new[::-1] and new in text
+    print(f"Longest palindrome in {args.length:,} characters: length {len(new)} ({'identical' if agree else 'MISMATCH'})")
+    print(f"  expand around centres  {old_time:8.3f}s")
+    print(f"  Manacher               {new_time:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
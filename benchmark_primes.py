@@ -0,0 +1,95 @@
+"""
+Benchmark of the primes module against the loops it replaced.
+
+    python benchmark_primes.py --n 20000 --count-limit 1000000000
+
+Lists the primes up to --n with the old nested loop from prime_1_100.py, with per-number
+trial division (the old is_prime from num_expressed_as _sum_of_primes.py) and with the
+segmented sieve, checks they agree, then counts primes up to --count-limit with the sieve.
+Then factors --factor-count random numbers below --factor-limit with the old prime_factors
+loop (on a sample) and with a batched smallest-prime-factor table.
+"""
+import argparse
+import time
+
+import numpy as np
+
+import primes
+from factorization import SPFTable
+
+
+def nested_loop_primes(num):
+    """prime_1_100.py before the primes module: O(n^2) nested loops."""
+    found = []
+    for i in range(2, num + 1):
+        for j in range(2, num + 1):
+            if i % j == 0:
+                break
+        if i == j:
+            found.append(i)
+    return found
+
+
+def trial_division_is_prime(n):
+    """is_prime from num_expressed_as _sum_of_primes.py before the primes module."""
+    if n <= 1:
+        return False
+    if n == 2:
+        return True
+    for i in range(2, int(n**0.5) + 1):
+        if n % i == 0:
+            return False
+    return True
+
+
+def increment_prime_factors(num):
+    """prime_factors from prime_factors_num.py before the factorization module."""
+    factors = []
+    factor = 2
+    while num >= 2:
+        if num % factor == 0:
+            factors.append(factor)
+            num = num / factor
+        else:
+            factor += 1
+    return factors
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    print(f"{label:<34} {time.perf_counter() - start:10.4f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=20000, help="list primes up to this with every method")
+    parser.add_argument("--count-limit", type=int, default=10**8, help="count primes up to this with the sieve")
+    parser.add_argument("--factor-count", type=int, default=10**6, help="how many numbers to factor")
+    parser.add_argument("--factor-limit", type=int, default=10**7, help="factor numbers below this")
+    args = parser.parse_args()
+
+    print(f"--- primes up to {args.n:,} ---")
+    nested = timed("nested loops (prime_1_100.py)", nested_loop_primes, args.n)
+    trial = timed("trial division is_prime", lambda n: [i for i in range(n + 1) if trial_division_is_prime(i)], args.n)
+    mr = timed("Miller-Rabin is_prime", lambda n: [i for i in range(n + 1) if primes.is_prime(i)], args.n)
+    sieve = timed("segmented sieve", lambda n: list(primes.primes(n)), args.n)
+    print(f"{len(sieve)} primes, {'identical' if nested == trial == mr == sieve else 'MISMATCH'}")
+
+    print(f"\n--- pi({args.count_limit:,}) ---")
+    count = timed("segmented sieve count", primes.count_primes, args.count_limit)
+    print(f"{count:,} primes")
+
+    print(f"\n--- factor {args.factor_count:,} numbers below {args.factor_limit:,} ---")
+    values = np.random.default_rng(0).integers(2, args.factor_limit, args.factor_count)
+    sample = values[:100].tolist()  # the old loop is linear in the largest prime factor
+    old = timed("old prime_factors, 100 numbers", lambda v: [increment_prime_factors(n) for n in v], sample)
+    table = timed("SPF table build", SPFTable, args.factor_limit)
+    found, offsets = timed("SPF factor_many, all numbers", table.factor_many, values)
+    same = all([int(p) for p in f] == found[offsets[i]:offsets[i + 1]].tolist() for i, f in enumerate(old))
+    print(f"{len(found):,} prime factors, sample {'identical' if same else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
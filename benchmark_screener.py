@@ -0,0 +1,120 @@
+"""
+Throughput benchmark for nse_screener and stock.analyze_growth on local fixture data.
+
+    python benchmark_screener.py --symbols 5000
+
+Generates deterministic synthetic data (once per size/seed) and reports symbols/sec,
+per-stage latency and the process's peak memory, so a change to the hot path can be
+compared against the previous run without touching the network.
+"""
+import argparse
+import contextlib
+import io
+import os
+import resource
+import sys
+import time
+
+import numpy as np
+
+import nse_screener
+import stock
+from data_providers import LocalFixtureProvider, generate_fixtures, set_provider
+from nse_panel import build_panel, screen_panel
+from screener_metrics import ScreenerMetrics, set_metrics
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024 # bytes on macOS, KiB elsewhere
+
+
+def report(stage, seconds, count, latencies=None):
+    line = f"{stage:<22} {seconds:8.3f}s  {count / seconds if seconds else float('inf'):>11,.0f} symbols/s"
+    if latencies is not None and len(latencies):
+        lat = np.asarray(latencies) * 1e6
+        line += f"  mean {lat.mean():8.1f}us  p95 {np.percentile(lat, 95):8.1f}us"
+    print(f"{line}  peak RSS {peak_rss_mb():7.1f} MB")
+
+
+def run_stage(func, items):
+    """Calls func on every item, returning (results, total seconds, per-item latencies)."""
+    results, latencies = [], []
+    start = time.perf_counter()
+    for item in items:
+        t = time.perf_counter()
+        results.append(func(item))
+        latencies.append(time.perf_counter() - t)
+    return results, time.perf_counter() - start, latencies
+
+
+def benchmark_screener(symbols):
+    print(f"\n--- nse_screener ({len(symbols)} symbols) ---")
+    data, seconds, lat = run_stage(nse_screener.get_ticker_data, symbols)
+    report("fetch (provider)", seconds, len(symbols), lat)
+    records = [(s, info, fin, bs) for s, (_, info, fin, bs) in zip(symbols, data)]
+
+    # Quiet metrics: rejections are counted, never formatted, so the timings measure the checks.
+    set_metrics(ScreenerMetrics(quiet=True))
+    prof, t_prof, l_prof = run_stage(lambda r: nse_screener.is_consistently_profitable(r[2], r[0]), records)
+    debt, t_debt, l_debt = run_stage(lambda r: nse_screener.has_low_debt(r[3], r[1], r[0]), records)
+    rets, t_rets, l_rets = run_stage(lambda r: nse_screener.has_good_returns(r[2], r[3], r[1], r[0]), records)
+    report("is_consistently_prof.", t_prof, len(records), l_prof)
+    report("has_low_debt", t_debt, len(records), l_debt)
+    report("has_good_returns", t_rets, len(records), l_rets)
+    scalar = [s for s, p, d, r in zip(symbols, prof, debt, rets) if p and d and r]
+
+    start = time.perf_counter()
+    panel = build_panel(records)
+    built = time.perf_counter()
+    metrics = screen_panel(panel, nse_screener.YEARS_FOR_PROFITABILITY, nse_screener.DEBT_TO_EQUITY_THRESHOLD,
+                           nse_screener.ROE_THRESHOLD, nse_screener.ROCE_THRESHOLD)
+    done = time.perf_counter()
+    report("panel build", built - start, len(records))
+    report("panel screen", done - built, len(records))
+    vectorized = metrics.index[metrics["qualified"]].tolist()
+    print(f"qualified: {len(scalar)} (per-symbol) / {len(vectorized)} (panel), "
+          f"{'identical' if scalar == vectorized else 'MISMATCH'}")
+
+
+def benchmark_growth(symbols):
+    print(f"\n--- stock.analyze_growth ({len(symbols)} symbols) ---")
+    base = [s[:-3] for s in symbols]
+    results = {}
+    for stage, batch_size in (("analyze_growth", None), ("analyze_growth batched", stock.BATCH_SIZE)):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            results[stage] = stock.analyze_growth(base, pause=0, batch_size=batch_size)
+        report(stage, time.perf_counter() - start, len(base))
+    per_symbol, batched = results.values()
+    print(f"doubled: {len(per_symbol)} (per-symbol) / {len(batched)} (batched), "
+          f"{'identical' if per_symbol == batched else 'MISMATCH'}")
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        tables = stock.scan_momentum(base)
+    report(f"momentum ({len(tables)} windows)", time.perf_counter() - start, len(base))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=5000, help="universe size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fixture-dir", default=None, help="where fixtures live (default: ./fixtures/<size>-<seed>)")
+    parser.add_argument("--skip-growth", action="store_true", help="only benchmark the screener")
+    args = parser.parse_args()
+
+    path = args.fixture_dir or os.path.join("fixtures", f"{args.symbols}-{args.seed}")
+    if not os.path.exists(os.path.join(path, "prices.npz")):
+        start = time.perf_counter()
+        generate_fixtures(path, n_symbols=args.symbols, seed=args.seed)
+        print(f"Generated fixtures in '{path}' ({time.perf_counter() - start:.1f}s)")
+    provider = set_provider(LocalFixtureProvider(path))
+
+    benchmark_screener(provider.symbols)
+    if not args.skip_growth:
+        benchmark_growth(provider.symbols)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Binomial coefficients and Pascal's triangle for large n.
+
+    python binomial.py --rows 10000 --mod 1000000007 > triangle.txt
+
+Rows come from the multiplicative recurrence C(n, k+1) = C(n, k) * (n - k) / (k + 1) or
+from the previous row by one vectorized addition; C(n, k) mod p comes from factorial and
+inverse-factorial tables (Lucas's theorem when n >= p); rendering goes through one buffered
+writer instead of a print call per coefficient.
+"""
+import argparse
+import math
+import sys
+from contextlib import contextmanager
+
+import numpy as np
+
+WRITE_BUFFER = 1 << 20
+FULL_TABLE_LIMIT = 10**7  # Largest p whose full 0 .. p - 1 tables are built by default
+
+
+def pascal_row(n):
+    """Row n of Pascal's triangle as Python ints, from the multiplicative recurrence (half + mirror)."""
+    half = [1]
+    for k in range(n // 2):
+        half.append(half[-1] * (n - k) // (k + 1))
+    return half + (half[::-1] if n % 2 else half[-2::-1])
+
+
+def pascal_rows(n_rows, mod=None):
+    """
+    Streams rows 0 .. n_rows - 1, each built from the previous one. Exact rows are Python
+    ints; with `mod`, rows are int64 NumPy arrays reduced mod `mod` (mod must be < 2**62).
+    """
+    if mod is None:
+        row = [1]
+        for _ in range(n_rows):
+            yield row
+            row = [1] + [a + b for a, b in zip(row, row[1:])] + [1]
+        return
+    row = np.ones(1, dtype=np.int64)
+    for _ in range(n_rows):
+        yield row
+        nxt = np.empty(len(row) + 1, dtype=np.int64)
+        nxt[0] = nxt[-1] = 1 % mod
+        np.add(row[:-1], row[1:], out=nxt[1:-1])
+        nxt[1:-1] %= mod
+        row = nxt
+
+
+def binomial(n, k):
+    """Exact C(n, k) (0 outside 0 <= k <= n)."""
+    return math.comb(n, k) if 0 <= k <= n else 0
+
+
+class BinomialMod:
+    """
+    C(n, k) mod a prime p from factorial / inverse-factorial tables up to min(limit, p - 1).
+    For p up to FULL_TABLE_LIMIT, `limit` may be omitted: the tables cover 0 .. p - 1 and
+    Lucas's theorem handles n >= p. Larger p (e.g. 1e9 + 7) need `limit`, the largest n used.
+    """
+
+    def __init__(self, p, limit=None):
+        if limit is None and p > FULL_TABLE_LIMIT:
+            raise ValueError(f"p = {p} is too large for full tables; pass limit, the largest n needed")
+        self.p = p
+        size = p if limit is None else min(limit + 1, p)
+        fact = [1] * size
+        for i in range(1, size):
+            fact[i] = fact[i - 1] * i % p
+        inv_fact = [1] * size
+        inv_fact[-1] = pow(fact[-1], p - 2, p)
+        for i in range(size - 1, 0, -1):
+            inv_fact[i - 1] = inv_fact[i] * i % p
+        self.fact = fact
+        self.inv_fact = inv_fact
+
+    def _small(self, n, k):
+        if k < 0 or k > n:
+            return 0
+        return self.fact[n] * self.inv_fact[k] % self.p * self.inv_fact[n - k] % self.p
+
+    def comb(self, n, k):
+        if k < 0 or k > n:
+            return 0
+        if n < len(self.fact):
+            return self._small(n, k)
+        if len(self.fact) < self.p:
+            raise ValueError(f"n = {n} needs tables up to {min(n, self.p - 1)}; raise `limit`")
+        result = 1
+        while n or k:  # Lucas: multiply the digit-wise binomials in base p
+            result = result * self._small(n % self.p, k % self.p) % self.p
+            if not result:
+                return 0
+            n, k = n // self.p, k // self.p
+        return result
+
+    def comb_many(self, n, k):
+        """Elementwise C(n, k) mod p for int arrays with 0 <= n < table size (p must be < 2**31)."""
+        n, k = np.broadcast_arrays(np.asarray(n, dtype=np.int64), np.asarray(k, dtype=np.int64))
+        if n.size and (n.min() < 0 or n.max() >= len(self.fact)):
+            raise ValueError(f"comb_many needs 0 <= n < {len(self.fact)}; raise `limit`")
+        fact = np.array(self.fact, dtype=np.int64)
+        inv_fact = np.array(self.inv_fact, dtype=np.int64)
+        valid = (0 <= k) & (k <= n)
+        k0, nk = np.where(valid, k, 0), np.where(valid, n - k, 0)
+        result = fact[np.where(valid, n, 0)] * inv_fact[k0] % self.p * inv_fact[nk] % self.p
+        return np.where(valid, result, 0)
+
+
+@contextmanager
+def _unlimited_int_str():
+    """Lifts Python's int-to-str digit limit (3.11+, 4300 digits by default) for the block."""
+    if not hasattr(sys, "set_int_max_str_digits"):
+        yield
+        return
+    previous = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        yield
+    finally:
+        sys.set_int_max_str_digits(previous)
+
+
+def write_triangle(n_rows, out=None, mod=None, centered=True):
+    """
+    Writes n_rows of Pascal's triangle to the binary stream `out` (default stdout), one row
+    per line, in WRITE_BUFFER-sized writes. Centered output matches pascal_triangle_n_rows.py:
+    row i (1-based) is indented by n_rows - i + 1 spaces and every number follows a space.
+    """
+    if out is None:
+        sys.stdout.flush()
+        out = sys.stdout.buffer
+    chunk, size = [], 0
+    with _unlimited_int_str():  # C(n, n/2) passes 4300 digits around row 14,300
+        for i, row in enumerate(pascal_rows(n_rows, mod), start=1):
+            values = row.tolist() if mod is not None else row
+            indent = " " * (n_rows - i + 1) if centered else ""
+            line = (indent + " " + " ".join(map(str, values)) + "\n").encode()
+            chunk.append(line)
+            size += len(line)
+            if size >= WRITE_BUFFER:
+                out.write(b"".join(chunk))
+                chunk, size = [], 0
+    out.write(b"".join(chunk))
+    out.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5)
+    parser.add_argument("--mod", type=int, default=None, help="print coefficients mod this (rows as NumPy arrays)")
+    parser.add_argument("--left", action="store_true", help="no centering indent")
+    args = parser.parse_args()
+    write_triangle(args.rows, mod=args.mod, centered=not args.left)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,7 @@
+from text_stats import VOWELS, count_chars
+
 def count_vowels(a):
-    count = 0  
-    for i in a:
-        if (i == 'a' or i == 'e' or i == 'i' or i == 'o' or i == 'u' or i == 'A' or i == 'E' or i == 'O' or i == 'U'):
-            count+=1
+    count = count_chars(a, VOWELS)  # a e i o u in both cases
     print(count)
 
 b = "i am learning python"
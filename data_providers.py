@@ -0,0 +1,204 @@
+import os
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+FIN_FIELDS = ("Net Income", "Ebit", "Total Revenue")
+BS_FIELDS = (
+    "Total Debt",
+    "Long Term Debt",
+    "Short Long Term Debt",
+    "Total Stockholder Equity",
+    "Total Assets",
+    "Total Current Liabilities",
+)
+PRICE_FIELDS = ("Open", "High", "Low", "Close", "Adj Close", "Volume")
+
+# yf.download periods as calendar offsets back from the latest bar
+PERIOD_OFFSETS = {
+    "5d": pd.DateOffset(days=5), "1mo": pd.DateOffset(months=1), "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6), "1y": pd.DateOffset(years=1), "2y": pd.DateOffset(years=2),
+    "5y": pd.DateOffset(years=5), "10y": pd.DateOffset(years=10),
+}
+
+
+def period_start(end, period):
+    """First date (exclusive) of a yf.download-style period ending at `end`; None for 'max'/unknown."""
+    offset = PERIOD_OFFSETS.get(period)
+    return None if offset is None else pd.Timestamp(end) - offset
+
+
+class YFinanceProvider:
+    """The live data source: thin pass-through to yfinance."""
+
+    name = "yfinance"
+
+    def ticker(self, symbol):
+        return yf.Ticker(symbol)
+
+    def download(self, tickers, **kwargs):
+        return yf.download(tickers, **kwargs)
+
+
+class FixtureTicker:
+    """Stands in for yf.Ticker; each property builds its DataFrame from the fixture arrays on access."""
+
+    def __init__(self, provider, index):
+        self._provider = provider
+        self._index = index
+
+    @property
+    def info(self):
+        return self._provider.info_for(self._index)
+
+    @property
+    def financials(self):
+        return self._provider.statement(self._index, "fin")
+
+    @property
+    def balance_sheet(self):
+        return self._provider.statement(self._index, "bs")
+
+
+class LocalFixtureProvider:
+    """
+    Serves deterministic synthetic fundamentals and daily OHLCV from files written by
+    generate_fixtures, shaped like yfinance's output, so the screener and growth scan
+    can be run and timed without the network. Unknown symbols come back empty.
+    """
+
+    name = "fixture"
+
+    def __init__(self, path):
+        self.path = path
+        with np.load(os.path.join(path, "fundamentals.npz")) as f:
+            self.symbols = [str(s) for s in f["symbols"]]
+            self.fin = f["fin"]
+            self.bs = f["bs"]
+            self.statement_dates = pd.DatetimeIndex(f["statement_dates"])
+            self.info_de = f["info_de"]
+            self.info_roe = f["info_roe"]
+        with np.load(os.path.join(path, "prices.npz")) as p:
+            self.price_dates = pd.DatetimeIndex(p["dates"])
+            self.close = p["close"]
+            self.volume = p["volume"]
+        self._index = {s: i for i, s in enumerate(self.symbols)}
+
+    def ticker(self, symbol):
+        return FixtureTicker(self, self._index.get(symbol))
+
+    def info_for(self, i):
+        if i is None:
+            return {}
+        info = {"symbol": self.symbols[i]}
+        if not np.isnan(self.info_de[i]):
+            info["debtToEquity"] = float(self.info_de[i])
+        if not np.isnan(self.info_roe[i]):
+            info["returnOnEquity"] = float(self.info_roe[i])
+        return info
+
+    def statement(self, i, kind):
+        if i is None:
+            return pd.DataFrame()
+        values, fields = (self.fin[i], FIN_FIELDS) if kind == "fin" else (self.bs[i], BS_FIELDS)
+        frame = pd.DataFrame(values, index=list(fields), columns=self.statement_dates)
+        # Rows yfinance didn't report are absent, not NaN.
+        return frame[~frame.isna().all(axis=1)]
+
+    def _window(self, period, start, end):
+        dates = self.price_dates
+        if start is not None or end is not None:
+            mask = np.ones(len(dates), dtype=bool)
+            if start is not None:
+                mask &= dates >= pd.Timestamp(start)
+            if end is not None:
+                mask &= dates < pd.Timestamp(end)
+            return np.flatnonzero(mask)
+        first = period_start(dates[-1], period)
+        return np.arange(len(dates)) if first is None else np.flatnonzero(dates > first)
+
+    def download(self, tickers, period="1mo", start=None, end=None, **kwargs):
+        """Mimics yf.download: flat columns for one ticker, (field, ticker) columns for several."""
+        single = isinstance(tickers, str) and len(tickers.split()) == 1
+        names = tickers.split() if isinstance(tickers, str) else list(tickers)
+        rows = self._window(period, start, end)
+        index = self.price_dates[rows]
+        cols = [self._index.get(n) for n in names]
+        close = np.full((len(rows), len(names)), np.nan)
+        volume = np.full((len(rows), len(names)), np.nan)
+        for j, c in enumerate(cols):
+            if c is not None:
+                close[:, j] = self.close[rows, c]
+                volume[:, j] = self.volume[rows, c]
+        fields = {"Open": close, "High": close, "Low": close, "Close": close, "Adj Close": close, "Volume": volume}
+        if single:
+            frame = pd.DataFrame({f: v[:, 0] for f, v in fields.items()}, index=index)
+            return frame.dropna(how="all")
+        frame = pd.concat({f: pd.DataFrame(v, index=index, columns=names) for f, v in fields.items()}, axis=1)
+        return frame.dropna(how="all")
+
+
+def generate_fixtures(path, n_symbols=5000, n_years=5, n_days=260, seed=0):
+    """
+    Writes deterministic synthetic fundamentals and prices for n_symbols to `path`.
+    The distributions are loosely tuned so that every screening criterion rejects some
+    symbols and a few percent qualify, and a few percent of price series double.
+    """
+    rng = np.random.default_rng(seed)
+    os.makedirs(path, exist_ok=True)
+    symbols = np.array([f"SYM{i:05d}.NS" for i in range(n_symbols)])
+
+    fin = np.full((n_symbols, len(FIN_FIELDS), n_years), np.nan)
+    revenue = rng.lognormal(8, 1.5, (n_symbols, 1)) * rng.uniform(0.8, 1.2, (n_symbols, n_years))
+    margin = rng.normal(0.08, 0.06, (n_symbols, 1)) + rng.normal(0, 0.05, (n_symbols, n_years))
+    fin[:, 0] = revenue * margin
+    fin[:, 1] = revenue * (margin + rng.uniform(0.02, 0.1, (n_symbols, 1)))
+    fin[:, 2] = revenue
+
+    bs = np.full((n_symbols, len(BS_FIELDS), n_years), np.nan)
+    equity = revenue * rng.uniform(0.2, 1.2, (n_symbols, 1))
+    ltd = equity * rng.uniform(0, 1.5, (n_symbols, 1))
+    sstd = equity * rng.uniform(0, 0.3, (n_symbols, 1))
+    bs[:, 0] = ltd + sstd
+    bs[:, 1] = ltd
+    bs[:, 2] = sstd
+    bs[:, 3] = equity
+    bs[:, 4] = equity + ltd + sstd + revenue * rng.uniform(0.1, 0.4, (n_symbols, 1))
+    bs[:, 5] = revenue * rng.uniform(0.1, 0.4, (n_symbols, 1))
+
+    # Knock out some data the way yfinance does: missing rows, missing years, missing statements.
+    bs[rng.random(n_symbols) < 0.3, 0] = np.nan
+    net_income = fin[:, 0]
+    net_income[rng.random((n_symbols, n_years)) < 0.02] = np.nan
+    fin[rng.random(n_symbols) < 0.03] = np.nan
+    bs[rng.random(n_symbols) < 0.03] = np.nan
+
+    info_de = np.where(rng.random(n_symbols) < 0.6, (bs[:, 1, 0] + bs[:, 2, 0]) / bs[:, 3, 0] * 100, np.nan)
+    info_roe = np.where(rng.random(n_symbols) < 0.6, fin[:, 0, 0] / bs[:, 3, 0], np.nan)
+
+    statement_dates = pd.date_range(end="2025-03-31", periods=n_years, freq="YE-MAR")[::-1]
+    np.savez(os.path.join(path, "fundamentals.npz"), symbols=symbols, fin=fin, bs=bs,
+             statement_dates=statement_dates.to_numpy(), info_de=info_de, info_roe=info_roe)
+
+    dates = pd.bdate_range(end="2025-06-30", periods=n_days)
+    drift = rng.normal(0.0005, 0.002, n_symbols)
+    returns = rng.normal(drift, 0.02, (n_days, n_symbols)).astype(np.float32)
+    close = (rng.lognormal(4, 1.2, n_symbols) * np.exp(np.cumsum(returns, axis=0))).astype(np.float32)
+    volume = (rng.lognormal(11.5, 1.5, n_symbols) * rng.uniform(0.5, 1.5, (n_days, n_symbols))).astype(np.float32)
+    np.savez(os.path.join(path, "prices.npz"), dates=dates.to_numpy(), close=close, volume=volume)
+    return path
+
+
+# The provider every fetch goes through; swap it with set_provider (e.g. for benchmarks).
+_provider = YFinanceProvider()
+
+
+def get_provider():
+    return _provider
+
+
+def set_provider(provider):
+    global _provider
+    _provider = provider
+    return provider
@@ -0,0 +1,80 @@
+import math
+from itertools import count
+
+import numpy as np
+
+from factorization import factorize
+from primes import is_prime
+
+
+def divisor_sieve(limit):
+    """
+    sigma[n] (sum of divisors) and tau[n] (number of divisors) for every n <= limit, as int64
+    arrays. Every divisor pair (k, n // k) with k <= sqrt(n) is added in the pass for k, so the
+    Python loop runs only sqrt(limit) times while NumPy does the O(N log N) additions.
+    """
+    sigma = np.zeros(limit + 1, dtype=np.int64)
+    tau = np.zeros(limit + 1, dtype=np.int64)
+    for k in range(1, math.isqrt(limit) + 1):
+        # n = k * j for j >= k: divisors k and j (just k when j == k)
+        cofactors = np.arange(k, limit // k + 1, dtype=np.int64)
+        sigma[k * k::k] += k + cofactors
+        tau[k * k::k] += 2
+        sigma[k * k] -= k
+        tau[k * k] -= 1
+    return sigma, tau
+
+
+def classify(limit):
+    """
+    (perfect, abundant, deficient) boolean masks over 0..limit, comparing each n with the sum
+    of its proper divisors sigma(n) - n. Index 0 is in none of them.
+    """
+    sigma, _ = divisor_sieve(limit)
+    n = np.arange(limit + 1)
+    aliquot = sigma - n
+    valid = n >= 1
+    return valid & (aliquot == n), valid & (aliquot > n), valid & (aliquot < n)
+
+
+def divisors_sqrt(n):
+    """All divisors of n, ascending, by testing every k up to sqrt(n)."""
+    small, large = [], []
+    for k in range(1, math.isqrt(n) + 1):
+        if n % k == 0:
+            small.append(k)
+            if k != n // k:
+                large.append(n // k)
+    return small + large[::-1]
+
+
+def divisors(n):
+    """All divisors of n, ascending, expanded from its prime factorization (any size of n)."""
+    result = [1]
+    factors = factorize(n)
+    for p in sorted(set(factors)):
+        powers = [p ** e for e in range(1, factors.count(p) + 1)]
+        result += [d * q for d in result for q in powers]
+    return sorted(result)
+
+
+def lucas_lehmer(p):
+    """True iff the Mersenne number 2**p - 1 is prime (p itself must be an odd prime)."""
+    m = (1 << p) - 1
+    s = 4
+    for _ in range(p - 2):
+        s = (s * s - 2) % m
+    return s == 0
+
+
+def perfect_numbers(limit=None):
+    """
+    Yields the even perfect numbers in increasing order (up to `limit` if given) via
+    Euclid-Euler: 2**(p-1) * (2**p - 1) for every Mersenne prime 2**p - 1.
+    """
+    for p in count(2):
+        n = (1 << (p - 1)) * ((1 << p) - 1)
+        if limit is not None and n > limit:
+            return
+        if is_prime(p) and (p == 2 or lucas_lehmer(p)):
+            yield n
@@ -1,13 +1,7 @@
+from gcd_lcm import gcd
+
 def euclidean_gcd(a,b):
-    if(a==0):
-        return b
-    if(b==0):
-        return a
-    if(a==b):
-        return a
-    if(a>b):
-        return euclidean_gcd(a-b, b)
-    else:
-        return euclidean_gcd(a, b-a)
+    # Iterative remainder Euclid: O(log min(a, b)) steps, no recursion depth limit
+    return gcd(a, b)
     
 print(euclidean_gcd(98,56))
\ No newline at end of file
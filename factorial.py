@@ -1,7 +1,7 @@
+from factorials import factorial as fast_factorial
+
 def factorial(num):
-    if num == 0 or num == 1:
-        return 1
-    else:
-        return num * factorial(num-1)
+    # Table lookup for small num, binary-splitting product (no recursion depth limit) above it
+    return fast_factorial(num)
     
 print(factorial(5))
\ No newline at end of file
@@ -0,0 +1,77 @@
+from functools import lru_cache
+
+import numpy as np
+
+SMALL_LIMIT = 100   # n! for n <= SMALL_LIMIT comes from a precomputed table
+MEMO_SIZE = 32      # Recent large results kept (each n! for n = 1e6 is ~2.3 MB)
+LEAF_SIZE = 16      # Below this many factors a range product is a plain loop
+
+
+def _odd_product(lo, hi):
+    """Product of the odd numbers in [lo, hi) (lo odd), split in halves so the big multiplies balance."""
+    count = (hi - lo + 1) // 2
+    if count <= LEAF_SIZE:
+        result = 1
+        for k in range(lo, hi, 2):
+            result *= k
+        return result
+    mid = lo + 2 * (count // 2)
+    return _odd_product(lo, mid) * _odd_product(mid, hi)
+
+
+def _binary_split_factorial(n):
+    """
+    n! = 2**(n - popcount(n)) * odd part, where the odd part is the product over i of the odd
+    numbers in (n >> (i + 1), n >> i], each raised to the power i + 1 by accumulation.
+    Every product is a balanced tree, so the multiplications are large-by-large.
+    """
+    odd_part, running = 1, 1
+    for shift in range(n.bit_length() - 1, -1, -1):
+        hi, lo = n >> shift, n >> (shift + 1)
+        # odd numbers in (lo, hi]
+        running *= _odd_product(lo + 1 if lo % 2 == 0 else lo + 2, hi + 1 if hi % 2 else hi)
+        odd_part *= running
+    return odd_part << (n - bin(n).count("1"))
+
+
+_SMALL = [1]
+for _k in range(1, SMALL_LIMIT + 1):
+    _SMALL.append(_SMALL[-1] * _k)
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _large_factorial(n):
+    return _binary_split_factorial(n)
+
+
+def factorial(n):
+    """n! for any int n >= 0: table lookup up to SMALL_LIMIT, else binary splitting (memoized)."""
+    if n < 0:
+        raise ValueError("factorial() not defined for negative values")
+    if n <= SMALL_LIMIT:
+        return _SMALL[n]
+    return _large_factorial(n)
+
+
+def factorials_mod(n, p):
+    """[0!, 1!, ..., n!] mod p as an int64 NumPy array (p < 2**31 so products fit)."""
+    table = np.zeros(n + 1, dtype=np.int64)
+    value = 1 % p
+    table[0] = value
+    limit = min(n, p - 1)  # k! mod p is 0 once k >= p
+    for k in range(1, limit + 1):
+        value = value * k % p
+        table[k] = value
+    return table
+
+
+def factorial_mod_many(values, p):
+    """Elementwise n! mod p for an int array, from one table up to the largest n."""
+    values = np.asarray(values, dtype=np.int64)
+    if not values.size:
+        return values.copy()
+    if values.min() < 0:
+        raise ValueError("factorial() not defined for negative values")
+    top = int(values.max())
+    table = factorials_mod(min(top, p), p)
+    return np.where(values >= p, 0, table[np.minimum(values, len(table) - 1)])
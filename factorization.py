@@ -0,0 +1,119 @@
+import math
+import random
+
+import numpy as np
+
+from primes import is_prime, small_primes
+
+TRIAL_PRIMES = small_primes(1000).tolist()  # Stripped off by trial division before Pollard-rho
+
+
+class SPFTable:
+    """
+    Smallest-prime-factor table for every n <= limit (int32, 4 bytes per number), giving
+    O(log n) factorization of any n in range: divide by spf[n] until 1 is left.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        spf = np.zeros(limit + 1, dtype=np.int32)
+        for p in small_primes(math.isqrt(limit)).tolist():
+            multiples = spf[p * p::p]
+            multiples[multiples == 0] = p
+        unmarked = np.flatnonzero(spf == 0)
+        spf[unmarked] = unmarked  # primes (and 0, 1) are their own entry
+        self.spf = spf
+
+    def factor(self, n):
+        """Prime factors of n (with multiplicity, ascending)."""
+        if not 1 <= n <= self.limit:
+            raise ValueError(f"{n} is outside the table (1..{self.limit})")
+        factors = []
+        while n > 1:
+            p = int(self.spf[n])
+            factors.append(p)
+            n //= p
+        return factors
+
+    def factor_many(self, values):
+        """
+        Factors a whole array at once: one vectorized division round per prime factor of the
+        most composite value. Returns (primes, offsets) with the factors of values[i] in
+        primes[offsets[i]:offsets[i + 1]], ascending.
+        """
+        values = np.asarray(values, dtype=np.int64)
+        if len(values) and (values.min() < 1 or values.max() > self.limit):
+            raise ValueError(f"values must be within 1..{self.limit}")
+        owners, found = [], []
+        index = np.arange(len(values))
+        rest = values.copy()
+        while len(rest):
+            active = rest > 1
+            index, rest = index[active], rest[active]
+            p = self.spf[rest]
+            owners.append(index)
+            found.append(p)
+            rest = rest // p
+        owners = np.concatenate(owners) if owners else np.empty(0, dtype=np.int64)
+        found = np.concatenate(found) if found else np.empty(0, dtype=np.int32)
+        order = np.argsort(owners, kind="stable")  # rounds already run in ascending prime order
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(owners, minlength=len(values)), out=offsets[1:])
+        return found[order], offsets
+
+
+def pollard_rho(n):
+    """A non-trivial factor of composite n (Brent's variant of Pollard's rho)."""
+    if n % 2 == 0:
+        return 2
+    while True:
+        y, c, m = random.randrange(1, n), random.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:  # the batched gcd overshot; step one at a time from the last checkpoint
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+def factorize(n, table=None):
+    """
+    Prime factors of any int n >= 1 (with multiplicity, ascending): an SPFTable lookup when
+    n fits in `table`, else trial division by the primes below 1000, then Miller-Rabin and
+    Pollard-rho on whatever is left.
+    """
+    if n < 1:
+        raise ValueError("n must be a positive integer")
+    if table is not None and n <= table.limit:
+        return table.factor(n)
+    factors = []
+    for p in TRIAL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if is_prime(m):
+            factors.append(m)
+        else:
+            d = pollard_rho(m)
+            stack.extend((d, m // d))
+    return sorted(factors)
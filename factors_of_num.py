@@ -1,5 +1,6 @@
+from divisors import divisors
+
 num = 21
 
-for i in range(2, num+1):
-    if(num % i ==0):
-        print(i, end=' ')
\ No newline at end of file
+for i in divisors(num)[1:]:
+    print(i, end=' ')
\ No newline at end of file
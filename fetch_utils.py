@@ -0,0 +1,63 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TokenBucket:
+    """Thread-safe token bucket: refills `rate` tokens per second, banks at most `burst`."""
+
+    def __init__(self, rate, burst=1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a token is available, then consumes it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def retry_call(func, *args, retries=3, backoff=1.0, max_backoff=30.0, **kwargs):
+    """
+    Calls func(*args, **kwargs), retrying up to `retries` times on any exception.
+    Waits backoff * 2**attempt seconds (with jitter, capped at max_backoff) between attempts
+    and re-raises the last exception once the retries are used up.
+    """
+    attempt = 0
+    while True:
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            if attempt >= retries:
+                raise
+            delay = min(max_backoff, backoff * (2 ** attempt))
+            time.sleep(delay * random.uniform(0.5, 1.0))
+            attempt += 1
+
+
+def map_concurrent(func, items, workers=8):
+    """
+    Runs func over items on a bounded thread pool and yields (item, result) pairs
+    in input order, so callers see the same sequence as a plain loop would produce.
+    """
+    items = list(items)
+    if workers is None or workers <= 1:
+        for item in items:
+            yield item, func(item)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for item, result in zip(items, executor.map(func, items)):
+            yield item, result
@@ -1,14 +1,7 @@
-def find_hcf(a,b):
-    if a>b:
-        smaller = b
-    else:
-        smaller = a
-    
-    for i in range(1, smaller + 1):
-        if (a % i == 0) and (b % i == 0):
-            hcf_num = i
+from gcd_lcm import gcd
 
-    return hcf_num
+def find_hcf(a,b):
+    return gcd(a, b)
 
 x = 3
 y = 21
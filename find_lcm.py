@@ -1,16 +1,8 @@
-def lcm(a,b):
-    if a>b:
-        greater = a
-    else:
-        greater = b
-
-    while(True):
-        if (greater%a==0) and (greater%b==0):
-            lcm_num=greater
-            print(lcm_num)
-            break
-        greater+=1
+from gcd_lcm import lcm as lcm_of
 
+def lcm(a,b):
+    lcm_num = lcm_of(a, b)
+    print(lcm_num)
     return lcm_num
 
 x = 12
@@ -0,0 +1,90 @@
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+
+DAY = 24 * 60 * 60
+
+# info carries prices and ratios that move daily; annual statements change a few times a year.
+DEFAULT_TTLS = {
+    "info": 1 * DAY,
+    "financials": 30 * DAY,
+    "balance_sheet": 30 * DAY,
+}
+
+
+def dataset_digest(value):
+    """Content hash of a dataset, as stored alongside each cache entry."""
+    return hashlib.sha1(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+
+
+class FundamentalsCache:
+    """
+    On-disk SQLite cache of yfinance datasets keyed by (symbol, dataset).
+
+    Values are pickled as-is, so DataFrames come back with their index, columns and dtypes intact.
+    Entries older than the dataset's TTL count as misses. In offline (replay) mode TTLs are
+    ignored and nothing is ever fetched: the cache is the only source of data.
+    """
+
+    def __init__(self, path="fundamentals_cache.sqlite", ttls=None, offline=False):
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        # One connection shared by the fetch threads; sqlite3 objects are not thread-safe on their own.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS datasets ("
+            " symbol TEXT NOT NULL,"
+            " dataset TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " digest TEXT NOT NULL,"
+            " payload BLOB NOT NULL,"
+            " PRIMARY KEY (symbol, dataset))"
+        )
+        self._conn.commit()
+
+    def get(self, symbol, dataset):
+        """Returns the cached value, or None if it is missing or older than its TTL."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, payload FROM datasets WHERE symbol = ? AND dataset = ?",
+                (symbol, dataset),
+            ).fetchone()
+            ttl = self.ttls.get(dataset)
+            if row is None or (not self.offline and ttl is not None and time.time() - row[0] > ttl):
+                self.misses += 1
+                return None
+            self.hits += 1
+        return pickle.loads(row[1])
+
+    def put(self, symbol, dataset, value):
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        digest = hashlib.sha1(payload).hexdigest()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO datasets (symbol, dataset, fetched_at, digest, payload)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (symbol, dataset, time.time(), digest, payload),
+            )
+            self._conn.commit()
+            self.writes += 1
+
+    def symbols(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT symbol FROM datasets ORDER BY symbol").fetchall()
+        return [r[0] for r in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def summary(self):
+        return f"cache: {self.hits} hits, {self.misses} misses, {self.writes} writes ({self.path})"
@@ -0,0 +1,64 @@
+from functools import reduce
+
+import numpy as np
+
+
+def gcd(a, b):
+    """Greatest common divisor by iterative Euclid (remainders, not subtraction): O(log min(a, b))."""
+    a, b = abs(a), abs(b)
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def lcm(a, b):
+    """Least common multiple, derived from the gcd; 0 if either argument is 0."""
+    if a == 0 or b == 0:
+        return 0
+    return abs(a // gcd(a, b) * b)
+
+
+def extended_gcd(a, b):
+    """(g, x, y) with a*x + b*y == g == gcd(a, b), iteratively."""
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_x, x = x, old_x - q * x
+        old_y, y = y, old_y - q * y
+    if old_r < 0:
+        old_r, old_x, old_y = -old_r, -old_x, -old_y
+    return old_r, old_x, old_y
+
+
+def gcd_list(values):
+    """gcd of every value in an iterable (0 for an empty one); stops early once it reaches 1."""
+    result = 0
+    for value in values:
+        result = gcd(result, value)
+        if result == 1:
+            break
+    return result
+
+
+def lcm_list(values):
+    """lcm of every value in an iterable (1 for an empty one), exact for Python ints of any size."""
+    return reduce(lcm, values, 1)
+
+
+def gcd_array(a, b):
+    """Elementwise gcd of two int arrays (broadcasting), computed in NumPy."""
+    return np.gcd(np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64))
+
+
+def lcm_array(a, b):
+    """Elementwise lcm of two int arrays; the results must fit in int64."""
+    return np.lcm(np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64))
+
+
+def gcd_reduce(values, axis=None):
+    """gcd over an int array (whole array, or along an axis)."""
+    values = np.asarray(values, dtype=np.int64)
+    return np.gcd.reduce(values.ravel() if axis is None else values, axis=0 if axis is None else axis)
@@ -0,0 +1,92 @@
+"""
+Goldbach decompositions for every number up to a limit at once.
+
+    python goldbach.py --limit 10000000 --counts --out goldbach.npy
+
+One prime sieve is built for the whole range and every lookup is a NumPy array operation,
+so checking all n up to 10**7 takes seconds instead of one trial-division loop per n.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from primes import prime_mask, primes_up_to
+
+
+def least_goldbach_primes(limit):
+    """
+    least[n] = the smallest prime p with n - p also prime and p <= n - p (0 if there is none),
+    for every n <= limit; the same pair num_expressed_as_sum_of_primes(n) prints.
+    Primes are tried in increasing order against every still-unresolved n at once.
+    """
+    mask = prime_mask(limit)
+    least = np.zeros(limit + 1, dtype=np.int32)
+    pending = np.arange(4, limit + 1)
+    for p in primes_up_to(limit // 2).tolist():
+        pending = pending[pending >= 2 * p]
+        hit = mask[pending - p]
+        least[pending[hit]] = p
+        pending = pending[~hit]
+        if p == 2:
+            pending = pending[pending % 2 == 0]  # an odd n can only be 2 + (n - 2)
+        if not len(pending):
+            break
+    return least
+
+
+def goldbach_counts(limit):
+    """
+    counts[n] = the number of unordered prime pairs p <= q with p + q = n, for every n <= limit.
+    The pairs of odd primes come from one FFT self-convolution of the odd-prime indicator;
+    pairs using 2 are added directly.
+    """
+    mask = prime_mask(limit)
+    counts = np.zeros(limit + 1, dtype=np.int32)
+    odd = mask[1::2].astype(np.float64)  # odd[k] <-> 2k + 1
+    if len(odd):
+        size = 1 << int(2 * len(odd) - 1).bit_length()
+        spectrum = np.fft.rfft(odd, size)
+        ordered = np.rint(np.fft.irfft(spectrum * spectrum, size)[:2 * len(odd) - 1]).astype(np.int64)
+        # ordered[j] counts (2a + 1) + (2b + 1) = 2j + 2 with a + b = j, in both orders.
+        n = 2 * np.arange(len(ordered)) + 2
+        keep = n <= limit
+        ordered, n = ordered[keep], n[keep]
+        square = mask[n // 2] & (n // 2 % 2 == 1)  # p == q is counted once, not twice
+        counts[n] = (ordered + square) // 2
+    if limit >= 4:
+        counts[4] += 1  # 2 + 2
+        q = np.flatnonzero(mask[3:limit - 1]) + 3  # odd n = 2 + q
+        counts[q + 2] += 1
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--limit", type=int, default=10**7)
+    parser.add_argument("--counts", action="store_true", help="also count every decomposition (FFT)")
+    parser.add_argument("--out", metavar="FILE", help="save the result array (.npy)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    least = least_goldbach_primes(args.limit)
+    evens = least[4::2]
+    print(f"Least decompositions for n <= {args.limit:,} in {time.perf_counter() - start:.2f}s; "
+          f"largest least prime {int(evens.max()) if len(evens) else 0}")
+    missing = 2 * np.flatnonzero(evens == 0) + 4
+    print("Every even n >= 4 is a sum of two primes." if not len(missing)
+          else f"No decomposition for: {missing[:20].tolist()}")
+    result = least
+
+    if args.counts:
+        start = time.perf_counter()
+        result = goldbach_counts(args.limit)
+        print(f"Decomposition counts in {time.perf_counter() - start:.2f}s; "
+              f"n = {args.limit - args.limit % 2} has {int(result[args.limit - args.limit % 2])}")
+    if args.out:
+        np.save(args.out, result)
+        print(f"Saved {result.dtype} array of {len(result):,} values to '{args.out}'.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+# Statement rows the screening criteria read. Column 0 of each frame is the latest fiscal year,
+# exactly as yfinance returns them and as the per-symbol criteria in nse_screener assume.
+FIN_FIELDS = ("Net Income", "Ebit")
+BS_FIELDS = (
+    "Total Debt",
+    "Long Term Debt",
+    "Short Long Term Debt",
+    "Total Stockholder Equity",
+    "Total Assets",
+    "Total Current Liabilities",
+)
+
+NI, EBIT = range(len(FIN_FIELDS))
+TD, LTD, SSTD, EQ, TA, TCL = range(len(BS_FIELDS))
+
+# How long after a fiscal year end its statements are assumed public (SEBI allows 60 days).
+REPORTING_LAG = pd.DateOffset(months=2)
+
+
+class FundamentalsPanel:
+    """
+    All symbols' statement rows aligned into float arrays:
+      fin[symbol, FIN_FIELDS, year], bs[symbol, BS_FIELDS, year]  (NaN-padded past each symbol's data)
+      fin_ncols / bs_ncols: how many fiscal-year columns each symbol really has
+      fin_dates / bs_dates: the fiscal-year column dates (NaT-padded)
+      info_de / info_roe: info['debtToEquity'] and info['returnOnEquity'] (NaN if missing)
+    built_at: when the panel was saved (time.time()), or None if never saved / unknown
+    """
+
+    _ARRAYS = ("fin", "bs", "fin_ncols", "bs_ncols", "fin_dates", "bs_dates", "info_de", "info_roe")
+
+    def __init__(self, symbols, fin, bs, fin_ncols, bs_ncols, fin_dates, bs_dates, info_de, info_roe):
+        self.symbols = list(symbols)
+        self.fin = fin
+        self.bs = bs
+        self.fin_ncols = fin_ncols
+        self.bs_ncols = bs_ncols
+        self.fin_dates = fin_dates
+        self.bs_dates = bs_dates
+        self.info_de = info_de
+        self.info_roe = info_roe
+        self.built_at = None
+
+    def __len__(self):
+        return len(self.symbols)
+
+    @property
+    def n_years(self):
+        return self.fin.shape[2]
+
+    def age(self):
+        """Seconds since the panel was saved (infinite if unknown)."""
+        return float("inf") if self.built_at is None else time.time() - self.built_at
+
+    def save(self, path):
+        """
+        Writes the panel as one .npy per array plus symbols.json and meta.json (build time)
+        under `path`, so load() can memory-map it and several processes share the same pages.
+        """
+        os.makedirs(path, exist_ok=True)
+        for name in self._ARRAYS:
+            np.save(os.path.join(path, f"{name}.npy"), getattr(self, name))
+        with open(os.path.join(path, "symbols.json"), "w", encoding="utf-8") as f:
+            json.dump(self.symbols, f)
+        self.built_at = time.time()
+        with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"built_at": self.built_at}, f)
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        with open(os.path.join(path, "symbols.json"), encoding="utf-8") as f:
+            symbols = json.load(f)
+        arrays = [np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode) for name in cls._ARRAYS]
+        panel = cls(symbols, *arrays)
+        meta_path = os.path.join(path, "meta.json")
+        if os.path.exists(meta_path):  # Panels saved before build times were recorded have none
+            with open(meta_path, encoding="utf-8") as f:
+                panel.built_at = json.load(f)["built_at"]
+        return panel
+
+
+def _info_value(info, key):
+    if info and key in info and info[key] is not None and not pd.isna(info[key]):
+        return float(info[key])
+    return np.nan
+
+
+def _statement_block(frame, fields):
+    """Returns (values[len(fields), ncols], dates[ncols]) for one statement frame."""
+    if frame is None or frame.empty:
+        return np.empty((len(fields), 0)), np.empty(0, dtype="datetime64[ns]")
+    frame = frame[~frame.index.duplicated(keep="first")]
+    rows = frame.reindex(list(fields))
+    try:
+        values = rows.to_numpy(dtype=float)
+    except (TypeError, ValueError):
+        # Non-numeric cells (e.g. strings) become NaN, like pd.to_numeric(errors="coerce").
+        values = rows.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+    dates = pd.to_datetime(frame.columns, errors="coerce").to_numpy(dtype="datetime64[ns]")
+    return values, dates
+
+
+class PanelBuilder:
+    """
+    Fills a FundamentalsPanel one symbol at a time. add() copies out just the FIN_FIELDS and
+    BS_FIELDS rows and the two info numbers, so the caller can drop the Ticker, info dict and
+    statement DataFrames right away instead of holding every symbol's until the panel is built.
+    """
+
+    def __init__(self):
+        self.symbols = []
+        self._fin = []
+        self._bs = []
+        self._fin_dates = []
+        self._bs_dates = []
+        self._info = []
+
+    def add(self, symbol, info, financials, balance_sheet):
+        fin, fin_dates = _statement_block(financials, FIN_FIELDS)
+        bs, bs_dates = _statement_block(balance_sheet, BS_FIELDS)
+        self.symbols.append(symbol)
+        self._fin.append(fin)
+        self._bs.append(bs)
+        self._fin_dates.append(fin_dates)
+        self._bs_dates.append(bs_dates)
+        self._info.append((_info_value(info, "debtToEquity"), _info_value(info, "returnOnEquity")))
+
+    def build(self):
+        n = len(self.symbols)
+        fin_ncols = np.array([f.shape[1] for f in self._fin], dtype=np.int64)
+        bs_ncols = np.array([b.shape[1] for b in self._bs], dtype=np.int64)
+        n_years = int(max([1] + fin_ncols.tolist() + bs_ncols.tolist()))
+        fin = np.full((n, len(FIN_FIELDS), n_years), np.nan)
+        bs = np.full((n, len(BS_FIELDS), n_years), np.nan)
+        fin_dates = np.full((n, n_years), np.datetime64("NaT"), dtype="datetime64[ns]")
+        bs_dates = np.full((n, n_years), np.datetime64("NaT"), dtype="datetime64[ns]")
+        for i in range(n):
+            fin[i, :, :fin_ncols[i]] = self._fin[i]
+            bs[i, :, :bs_ncols[i]] = self._bs[i]
+            fin_dates[i, :fin_ncols[i]] = self._fin_dates[i]
+            bs_dates[i, :bs_ncols[i]] = self._bs_dates[i]
+        info = np.array(self._info, dtype=float).reshape(n, 2)
+        return FundamentalsPanel(self.symbols, fin, bs, fin_ncols, bs_ncols, fin_dates, bs_dates,
+                                 info[:, 0].copy(), info[:, 1].copy())
+
+
+def screening_inputs(info, financials, balance_sheet):
+    """
+    Per dataset, just what the screening criteria read, as bytes: the FIN_FIELDS / BS_FIELDS
+    rows with their fiscal-year dates, and whether info is present plus its D/E and ROE.
+    Hashing these instead of whole datasets ignores info's quote fields (price, volume,
+    market cap), which move every day without changing any result.
+    """
+    inputs = {}
+    for name, frame, fields in (("financials", financials, FIN_FIELDS), ("balance_sheet", balance_sheet, BS_FIELDS)):
+        values, dates = _statement_block(frame, fields)
+        inputs[name] = values.tobytes() + dates.tobytes()
+    info_values = (float(bool(info)), _info_value(info, "debtToEquity"), _info_value(info, "returnOnEquity"))
+    inputs["info"] = np.array(info_values).tobytes()
+    return inputs
+
+
+def build_panel(records):
+    """
+    Builds a FundamentalsPanel from (symbol, info, financials, balance_sheet) tuples,
+    e.g. the output of nse_screener.get_ticker_data for every symbol. `records` may be a
+    generator; each record can be garbage-collected as soon as it has been read.
+    """
+    builder = PanelBuilder()
+    for symbol, info, financials, balance_sheet in records:
+        builder.add(symbol, info, financials, balance_sheet)
+    return builder.build()
+
+
+def _shift_columns(values, dates, ncols, available):
+    """
+    Drops each symbol's statement columns that weren't available yet: row i is shifted left so
+    its first available column becomes column 0. `available` is a symbols x years bool mask.
+    """
+    n, n_years = dates.shape
+    first = np.where(available.any(axis=1), available.argmax(axis=1), n_years)
+    idx = first[:, None] + np.arange(n_years)
+    inside = idx < n_years
+    idx = np.minimum(idx, n_years - 1)
+    shifted = np.where(inside[:, None, :], np.take_along_axis(values, idx[:, None, :], axis=2), np.nan)
+    shifted_dates = np.where(inside, np.take_along_axis(dates, idx, axis=1), np.datetime64("NaT"))
+    return shifted, shifted_dates, np.maximum(ncols - first, 0)
+
+
+def panel_as_of(panel, date, lag=REPORTING_LAG):
+    """
+    The panel as an investor would have seen it on `date`: only fiscal years whose statements
+    were published (fiscal year end + `lag`) by then, latest first. info describes today, so
+    info D/E and ROE are dropped and the metrics fall back to the statements.
+    """
+    cutoff = np.datetime64(pd.Timestamp(date) - lag, "ns")
+    fin, fin_dates, fin_ncols = _shift_columns(panel.fin, panel.fin_dates, panel.fin_ncols,
+                                               panel.fin_dates <= cutoff)
+    bs, bs_dates, bs_ncols = _shift_columns(panel.bs, panel.bs_dates, panel.bs_ncols,
+                                            panel.bs_dates <= cutoff)
+    missing = np.full(len(panel), np.nan)
+    return FundamentalsPanel(panel.symbols, fin, bs, fin_ncols, bs_ncols, fin_dates, bs_dates,
+                             missing, missing.copy())
+
+
+def _balance_sheet_debt(td, ltd, sstd):
+    """Total Debt, falling back to Long Term Debt + Short Long Term Debt like has_low_debt does."""
+    ltd_val = np.nan_to_num(ltd, nan=0.0)
+    sstd_val = np.nan_to_num(sstd, nan=0.0)
+    calculated = ltd_val + sstd_val
+    fallback = np.where(calculated != 0, calculated,
+                        np.where(~np.isnan(ltd) & (ltd != 0), ltd, np.nan))
+    return np.where(np.isnan(td), fallback, td)
+
+
+def compute_metrics(panel, years, col=0):
+    """
+    Computes every screening metric for all symbols at once, as of statement column `col`
+    (0 = latest fiscal year). Returns a DataFrame indexed by symbol.
+    info-based D/E and ROE are only used for col 0, since info describes today.
+    """
+    fin, bs = panel.fin, panel.bs
+    ncols_needed = col + years
+
+    # Profitability: the `years` columns starting at `col` must exist, be non-NaN and positive.
+    if fin.shape[2] >= ncols_needed:
+        window = fin[:, NI, col:ncols_needed]
+        profitable_years = (window > 0).sum(axis=1)
+        profitable = (panel.fin_ncols >= ncols_needed) & (profitable_years == years)
+    else:
+        profitable_years = np.zeros(len(panel), dtype=np.int64)
+        profitable = np.zeros(len(panel), dtype=bool)
+
+    # Consecutive positive Net Income years going back from `col`.
+    if fin.shape[2] > col:
+        positive = fin[:, NI, col:] > 0
+        profit_streak = np.where(positive.all(axis=1), positive.shape[1], positive.argmin(axis=1))
+    else:
+        profit_streak = np.zeros(len(panel), dtype=np.int64)
+
+    if fin.shape[2] > col:
+        ni, ebit = fin[:, NI, col], fin[:, EBIT, col]
+        td, ltd, sstd, eq, ta, tcl = (bs[:, k, col] for k in range(len(BS_FIELDS)))
+    else:
+        ni = ebit = td = ltd = sstd = eq = ta = tcl = np.full(len(panel), np.nan)
+    info_de = panel.info_de if col == 0 else np.full(len(panel), np.nan)
+    info_roe = panel.info_roe if col == 0 else np.full(len(panel), np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Debt to equity: info (percent or ratio) first, then the balance sheet.
+        total_debt = _balance_sheet_debt(td, ltd, sstd)
+        de_info = np.where(info_de > 5, info_de / 100.0, info_de)
+        de_bs = np.where(~np.isnan(total_debt) & ~np.isnan(eq) & (eq != 0), total_debt / eq, np.nan)
+        de_ratio = np.where(~np.isnan(info_de), de_info, de_bs)
+
+        # ROE: info first, then latest Net Income / Stockholder Equity.
+        roe_calc = np.where(~np.isnan(eq) & (eq != 0) & ~np.isnan(ni), ni / eq, np.nan)
+        roe = np.where(~np.isnan(info_roe), info_roe, roe_calc)
+
+        # ROCE: EBIT / (Total Assets - Current Liabilities), else / (Equity + Debt).
+        ce_assets = ta - tcl
+        capital_employed = np.where(~np.isnan(ce_assets) & (ce_assets != 0), ce_assets, np.nan)
+        debt_for_ce = np.where(np.isnan(td), np.nan_to_num(ltd, nan=0.0) + np.nan_to_num(sstd, nan=0.0), td)
+        ce_equity = eq + debt_for_ce
+        capital_employed = np.where(np.isnan(capital_employed) & ~np.isnan(ce_equity) & (ce_equity != 0),
+                                    ce_equity, capital_employed)
+        roce = np.where(~np.isnan(ebit) & ~np.isnan(capital_employed) & (capital_employed != 0),
+                        ebit / capital_employed, np.nan)
+
+    has_statements = (panel.fin_ncols > col) & (panel.bs_ncols > col)
+    return pd.DataFrame({
+        "profitable_years": profitable_years,
+        "profitable": profitable,
+        "profit_streak": profit_streak,
+        "de_ratio": de_ratio,
+        "roe": roe,
+        "roce": roce,
+        "has_statements": has_statements,
+    }, index=pd.Index(panel.symbols, name="symbol"))
+
+
+def screen_panel(panel, years, de_threshold, roe_threshold, roce_threshold, col=0):
+    """
+    Vectorized equivalent of is_consistently_profitable, has_low_debt and has_good_returns.
+    Returns the metrics table with one boolean column per criterion plus 'qualified'.
+    """
+    metrics = compute_metrics(panel, years, col)
+    # NaN compares False, so undeterminable metrics fail just like in the per-symbol checks.
+    metrics["low_debt"] = metrics["de_ratio"].to_numpy() < de_threshold
+    metrics["good_returns"] = (metrics["has_statements"].to_numpy()
+                               & (metrics["roe"].to_numpy() > roe_threshold)
+                               & (metrics["roce"].to_numpy() > roce_threshold))
+    metrics["qualified"] = metrics["profitable"] & metrics["low_debt"] & metrics["good_returns"]
+    return metrics
@@ -1,6 +1,19 @@
-import yfinance as yf
 import pandas as pd
 import time
+import argparse
+import math
+import os
+from collections import namedtuple
+from functools import partial
+from data_providers import LocalFixtureProvider, get_provider, set_provider
+from nse_universe import cached_parse
+from fetch_utils import TokenBucket, retry_call, map_concurrent
+from screener_metrics import ScreenerMetrics, get_metrics, set_metrics, timed_criterion
+from fundamentals_cache import DAY, DEFAULT_TTLS, FundamentalsCache, dataset_digest
+from nse_panel import FundamentalsPanel, PanelBuilder, build_panel, screen_panel, compute_metrics, screening_inputs
+from screen_rules import compile_screens, load_screens, run_screens
+from screen_backtest import backtest, load_closes
+from screen_journal import ScreenJournal
 # We'll comment out nsepython imports for now to ensure the script runs with CSV
 # from nsepython import ... # We can revisit this if a stable method is found
 
@@ -12,49 +25,72 @@ ROCE_THRESHOLD = 0.15 # 15%
 NIFTY_INDEX_NAME = "NIFTY 500" 
 CSV_FILENAME = "nifty_500_constituents.csv" # Make sure this file exists!
 
+# --- Fetch Engine ---
+FETCH_WORKERS = 8       # Worker threads for concurrent mode
+FETCH_RATE = 2.0        # Sustained yfinance requests per second (shared by all workers)
+FETCH_BURST = 5         # Requests allowed back-to-back before the rate limit kicks in
+FETCH_RETRIES = 3       # Retries per symbol on fetch errors
+FETCH_BACKOFF = 1.0     # Base backoff in seconds (doubles on every retry)
+
+# --- Fundamentals Cache ---
+CACHE_FILENAME = "fundamentals_cache.sqlite"
+TICKER_DATASETS = ("info", "financials", "balance_sheet")
+PANEL_MAX_AGE = DEFAULT_TTLS["financials"] # Seconds; an older saved --panel is rebuilt
+
+# --- Progress Journal ---
+JOURNAL_FILENAME = "screen_journal.jsonl"
+
 # --- NSE Symbol Fetching ---
+# Common column names for symbols in NSE downloaded CSVs
+POTENTIAL_SYMBOL_COLUMNS = ['symbol', 'security name', 'company name']
+
+def _parse_index_csv(csv_filename):
+    """
+    Returns (symbol column, symbols, filtered by EQ series). Only the symbol and 'series'
+    columns are parsed. Raises KeyError listing the available columns when none of
+    POTENTIAL_SYMBOL_COLUMNS is present.
+    """
+    header = [col.lower().strip() for col in pd.read_csv(csv_filename, nrows=0).columns]
+    symbol_col_found = next((col for col in POTENTIAL_SYMBOL_COLUMNS if col in header), None)
+    if symbol_col_found is None:
+        raise KeyError(f"no symbol column (like {POTENTIAL_SYMBOL_COLUMNS}); "
+                       f"available columns in CSV (lowercased): {header}")
+
+    wanted = {symbol_col_found, 'series'}
+    df = pd.read_csv(csv_filename, usecols=lambda col: col.lower().strip() in wanted)
+    df.columns = [col.lower().strip() for col in df.columns] # Standardize column names
+
+    # If using 'company name', it's often the symbol itself in index constituents.
+    # If 'series' column exists, we might filter for 'EQ', but for index constituents,
+    # 'company name' usually directly maps to the equity symbol.
+    eq_filtered = False
+    if symbol_col_found == 'company name' and 'series' in df.columns:
+        # Check if filtering by 'EQ' series is necessary or if all entries are relevant
+        # For NIFTY 500, 'company name' is typically the symbol.
+        # If distinct symbols are much less than rows, then series 'EQ' might be good.
+        eq_rows = df['series'] == 'EQ'
+        if 0 < eq_rows.sum() < len(df):
+            df = df[eq_rows]
+            eq_filtered = True
+
+    symbols = df[symbol_col_found].astype(str).str.strip().tolist()
+    symbols = [s for s in symbols if pd.notna(s) and s and s != "nan"] # Clean symbols
+    return symbol_col_found, symbols, eq_filtered
+
 def get_index_symbols_from_csv(index_name="NIFTY 500", csv_filename="nifty_500_constituents.csv"):
     """
     Loads stock symbols for a given NSE index primarily from a local CSV file.
     Returns a list of symbols (e.g., ['RELIANCE', 'INFY']) or an empty list on failure.
+    The parsed list is kept in a binary sidecar file and reused until the CSV changes.
     """
     print(f"Loading symbols for {index_name} from local CSV: '{csv_filename}'...")
     symbols = []
     try:
-        df = pd.read_csv(csv_filename)
-        df.columns = [col.lower().strip() for col in df.columns] # Standardize column names
-
-        # Common column names for symbols in NSE downloaded CSVs
-        potential_symbol_columns = ['symbol', 'security name', 'company name'] 
-        symbol_col_found = None
+        symbol_col_found, symbols, eq_filtered = cached_parse(csv_filename, "index_symbols", _parse_index_csv)
 
-        for col_name in potential_symbol_columns:
-            if col_name in df.columns:
-                symbol_col_found = col_name
-                break
-        
-        if symbol_col_found:
-            print(f"Using column '{symbol_col_found}' from CSV for stock symbols.")
-            # If using 'company name', it's often the symbol itself in index constituents.
-            # If 'series' column exists, we might filter for 'EQ', but for index constituents,
-            # 'company name' usually directly maps to the equity symbol.
-            if symbol_col_found == 'company name' and 'series' in df.columns:
-                # Check if filtering by 'EQ' series is necessary or if all entries are relevant
-                # For NIFTY 500, 'company name' is typically the symbol.
-                # If distinct symbols are much less than rows, then series 'EQ' might be good.
-                if len(df[df['series'] == 'EQ']) > 0 and len(df[df['series'] == 'EQ']) < len(df):
-                     print("Filtering by 'EQ' series for 'company name' column.")
-                     symbols = df[df['series'] == 'EQ'][symbol_col_found].astype(str).str.strip().tolist()
-                else:
-                    symbols = df[symbol_col_found].astype(str).str.strip().tolist()
-            else:
-                symbols = df[symbol_col_found].astype(str).str.strip().tolist()
-        else:
-            print(f"Error: CSV file '{csv_filename}' found, but a suitable symbol column (like {potential_symbol_columns}) was not found.")
-            print(f"Available columns in CSV (lowercased): {df.columns.tolist()}")
-            return []
-        
-        symbols = [s for s in symbols if pd.notna(s) and s and s != "nan"] # Clean symbols
+        print(f"Using column '{symbol_col_found}' from CSV for stock symbols.")
+        if eq_filtered:
+            print("Filtering by 'EQ' series for 'company name' column.")
 
         if symbols:
             print(f"Successfully loaded {len(symbols)} symbols from {csv_filename}.")
@@ -75,6 +111,9 @@ def get_index_symbols_from_csv(index_name="NIFTY 500", csv_filename="nifty_500_c
         print(f"  5. Ensure the CSV file has a column like 'Symbol', 'Security Name', or 'Company Name' containing the stock tickers.")
         print(f"-----------------")
         return []
+    except KeyError as ex_columns:
+        print(f"Error: CSV file '{csv_filename}' found, but it has {ex_columns.args[0]}")
+        return []
     except Exception as ex_csv:
         print(f"Error reading or processing CSV '{csv_filename}': {ex_csv}")
         return []
@@ -88,13 +127,54 @@ def get_index_symbols_from_csv(index_name="NIFTY 500", csv_filename="nifty_500_c
 import os # For showing current directory in case of FileNotFoundError
 
 # --- PASTE YOUR FINANCIAL FUNCTIONS HERE (get_ticker_data, is_consistently_profitable, etc.) ---
-def get_ticker_data(symbol_with_suffix):
-    """Fetches data for a given stock symbol (e.g., RELIANCE.NS)."""
+def _empty_dataset(name):
+    return {} if name == "info" else pd.DataFrame()
+
+def _is_empty_dataset(value):
+    return value is None or (len(value) == 0 if isinstance(value, dict) else value.empty)
+
+def _load_dataset(stock, symbol_with_suffix, name, limiter=None, cache=None, fetched=None):
+    """
+    Returns one dataset, from the cache if fresh, else from yfinance; raises on network errors.
+    Names that had to go to the network are added to the optional set `fetched`.
+    """
+    if cache:
+        with get_metrics().timer(f"cache.{name}"):
+            value = cache.get(symbol_with_suffix, name)
+    else:
+        value = None
+    if value is None and cache is not None and cache.offline:
+        return _empty_dataset(name) # Replay mode never touches the network
+    if value is None:
+        # Each yfinance property is a separate request, so each one takes a token.
+        if limiter: limiter.acquire()
+        if fetched is not None:
+            fetched.add(name)
+        with get_metrics().timer(f"fetch.{name}"):
+            value = getattr(stock, name)
+        # Empty results are what yfinance returns when throttled or failing transiently; caching
+        # them would serve "no data" for the whole TTL (or forever under --replay).
+        if cache is not None and not _is_empty_dataset(value):
+            cache.put(symbol_with_suffix, name, value)
+    return value
+
+def _fetch_ticker_data(symbol_with_suffix, limiter=None, cache=None, fetched=None):
+    """Loads info, financials and balance sheet, from the cache where fresh; raises on network errors."""
+    stock = get_provider().ticker(symbol_with_suffix) # No request until a property is read
+    data = {name: _load_dataset(stock, symbol_with_suffix, name, limiter, cache, fetched) for name in TICKER_DATASETS}
+    return stock, data["info"], data["financials"], data["balance_sheet"]
+
+def get_ticker_data(symbol_with_suffix, limiter=None, retries=0, backoff=FETCH_BACKOFF, cache=None, fetched=None):
+    """
+    Fetches data for a given stock symbol (e.g., RELIANCE.NS).
+    With a TokenBucket `limiter` every request waits for a token; failures are retried
+    `retries` times with exponential backoff before giving up. With a FundamentalsCache,
+    fresh datasets are served from disk and only stale or missing ones are downloaded.
+    Dataset names that went to the network (even if the request failed) are added to `fetched`.
+    """
     try:
-        stock = yf.Ticker(symbol_with_suffix)
-        info = stock.info
-        financials = stock.financials # Annual
-        balance_sheet = stock.balance_sheet # Annual
+        stock, info, financials, balance_sheet = retry_call(
+            _fetch_ticker_data, symbol_with_suffix, limiter, cache, fetched, retries=retries, backoff=backoff)
         
         if not info and financials.empty and balance_sheet.empty:
              # print(f"  - Data: No data returned by yfinance for {symbol_with_suffix}.") # Too verbose
@@ -104,25 +184,88 @@ def get_ticker_data(symbol_with_suffix):
         # print(f"  - Data: Could not fetch yfinance data for {symbol_with_suffix}: {e}") # Can be too verbose
         return None, None, None, None
 
+def _report(symbol, stage, reason, message, *args):
+    """Counts a failure reason; the message is only formatted if it will be printed or logged."""
+    get_metrics().report(symbol, stage, reason, message, *args)
+
+def _diagnose(symbol, stage, reason, message, *args):
+    """A note on the way to a rejection (reported separately by _report), counted on its own."""
+    get_metrics().diagnose(symbol, stage, reason, message, *args)
+
+def _qualified(symbol_ns, note=""):
+    metrics = get_metrics()
+    metrics.event("qualified", symbol=symbol_ns)
+    metrics.log("--- {} QUALIFIED{} ---", symbol_ns, note)
+
+class LazyTickerData:
+    """
+    Ticker data that fetches each dataset the first time it is read and memoizes it,
+    so a symbol rejected on financials never downloads its info or balance sheet.
+    A dataset that still fails after `retries` reads as None. Unlike get_ticker_data, where
+    any failure makes all four values None, failures are per dataset: the other datasets
+    still load, and a criterion reading the failed one sees it as unavailable.
+    """
+
+    def __init__(self, symbol_with_suffix, limiter=None, retries=0, backoff=FETCH_BACKOFF, cache=None):
+        self.symbol = symbol_with_suffix
+        self.stock = get_provider().ticker(symbol_with_suffix)
+        self.limiter = limiter
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = cache
+        self._loaded = {}
+        self._fetched = set()
+
+    def get(self, name):
+        if name not in self._loaded:
+            try:
+                self._loaded[name] = retry_call(_load_dataset, self.stock, self.symbol, name, self.limiter,
+                                                self.cache, self._fetched, retries=self.retries, backoff=self.backoff)
+            except Exception:
+                self._loaded[name] = None
+        return self._loaded[name]
+
+    @property
+    def info(self):
+        return self.get("info")
+
+    @property
+    def financials(self):
+        return self.get("financials")
+
+    @property
+    def balance_sheet(self):
+        return self.get("balance_sheet")
+
+    @property
+    def datasets_loaded(self):
+        return len(self._loaded)
+
+    @property
+    def datasets_fetched(self):
+        """Datasets that went to the network (cache misses), as opposed to datasets_loaded."""
+        return len(self._fetched)
+
+@timed_criterion("profitability")
 def is_consistently_profitable(financials, symbol, years=YEARS_FOR_PROFITABILITY):
     """Checks if 'Net Income' has been positive for the last 'years'."""
     if financials is None or financials.empty:
-        print(f"  - {symbol} | Profitability: Financials data not available.")
+        _report(symbol, "Profitability", "no_financials", "Financials data not available.")
         return False
     try:
         if 'Net Income' not in financials.index:
-            print(f"  - {symbol} | Profitability: 'Net Income' not found in financials.")
+            _report(symbol, "Profitability", "no_net_income", "'Net Income' not found in financials.")
             return False
 
-        net_income_series = financials.loc['Net Income']
+        net_income_series = financials.loc[['Net Income']] # Keep it a 1-row frame so .columns/.iloc[:, ...] work
         if len(net_income_series.columns) < years: 
-            print(f"  - {symbol} | Profitability: Not enough data (available: {len(net_income_series.columns)}, needed: {years}).")
+            _report(symbol, "Profitability", "not_enough_years", "Not enough data (available: {}, needed: {}).", len(net_income_series.columns), years)
             return False
 
         recent_net_incomes = net_income_series.iloc[:, :years] 
         
         if recent_net_incomes.isnull().values.any(): 
-            print(f"  - {symbol} | Profitability: Contains NaN values in net income for the last {years} years.")
+            _report(symbol, "Profitability", "nan_net_income", "Contains NaN values in net income for the last {} years.", years)
             return False
             
         profitable_years = (recent_net_incomes > 0).all(axis=None) 
@@ -131,15 +274,16 @@ def is_consistently_profitable(financials, symbol, years=YEARS_FOR_PROFITABILITY
             return True
         else:
             num_profitable = (recent_net_incomes > 0).sum().sum() 
-            print(f"  - {symbol} | Profitability: Not consistently profitable (profitable in {num_profitable}/{recent_net_incomes.size} periods of last {years} years). (Fail)")
+            _report(symbol, "Profitability", "loss_years", "Not consistently profitable (profitable in {}/{} periods of last {} years). (Fail)", num_profitable, recent_net_incomes.size, years)
             return False
     except KeyError:
-        print(f"  - {symbol} | Profitability: 'Net Income' key missing from financials.")
+        _report(symbol, "Profitability", "no_net_income", "'Net Income' key missing from financials.")
         return False
     except Exception as e:
-        print(f"  - {symbol} | Profitability: Error checking profitability: {e}")
+        _report(symbol, "Profitability", "error", "Error checking profitability: {}", e)
         return False
 
+@timed_criterion("debt")
 def has_low_debt(balance_sheet, info, symbol, threshold=DEBT_TO_EQUITY_THRESHOLD):
     """Checks if Debt-to-Equity ratio is below the threshold."""
     d_e_ratio = None
@@ -149,7 +293,7 @@ def has_low_debt(balance_sheet, info, symbol, threshold=DEBT_TO_EQUITY_THRESHOLD
     
     if d_e_ratio is None: # Only calculate if not found in info or info value was NaN
         if balance_sheet is None or balance_sheet.empty:
-            print(f"  - {symbol} | Debt: Balance sheet data not available for D/E calculation.")
+            _report(symbol, "Debt", "no_balance_sheet", "Balance sheet data not available for D/E calculation.")
             return False
         try:
             latest_balance_sheet = balance_sheet.iloc[:, 0] 
@@ -173,37 +317,38 @@ def has_low_debt(balance_sheet, info, symbol, threshold=DEBT_TO_EQUITY_THRESHOLD
             shareholder_equity = latest_balance_sheet.get('Total Stockholder Equity')
 
             if total_debt is None or pd.isna(total_debt): 
-                print(f"  - {symbol} | Debt: Could not determine valid Total Debt from balance sheet.")
+                _report(symbol, "Debt", "no_total_debt", "Could not determine valid Total Debt from balance sheet.")
                 return False
             if shareholder_equity is None or pd.isna(shareholder_equity):
-                print(f"  - {symbol} | Debt: Could not determine valid Shareholder Equity from balance sheet.")
+                _report(symbol, "Debt", "no_equity", "Could not determine valid Shareholder Equity from balance sheet.")
                 return False
             if shareholder_equity == 0:
-                print(f"  - {symbol} | Debt: Shareholder Equity is zero. D/E is effectively infinite or undefined.")
+                _report(symbol, "Debt", "zero_equity", "Shareholder Equity is zero. D/E is effectively infinite or undefined.")
                 return False 
 
             d_e_ratio = total_debt / shareholder_equity
         except (KeyError, IndexError) as e:
-            print(f"  - {symbol} | Debt: Missing key/data in balance sheet for D/E calculation: {e}")
+            _report(symbol, "Debt", "missing_data", "Missing key/data in balance sheet for D/E calculation: {}", e)
             return False
         except Exception as e:
-            print(f"  - {symbol} | Debt: Error calculating D/E: {e}")
+            _report(symbol, "Debt", "error", "Error calculating D/E: {}", e)
             return False
             
     if d_e_ratio is not None and not pd.isna(d_e_ratio) and d_e_ratio < threshold:
         return True
     else:
         if d_e_ratio is not None and not pd.isna(d_e_ratio):
-            print(f"  - {symbol} | Debt: High debt (D/E: {d_e_ratio:.2f} >= {threshold}). (Fail)")
+            _report(symbol, "Debt", "high_debt", "High debt (D/E: {:.2f} >= {}). (Fail)", d_e_ratio, threshold)
         elif pd.isna(d_e_ratio):
-             print(f"  - {symbol} | Debt: D/E ratio calculated as NaN or from NaN source. (Fail)")
+             _report(symbol, "Debt", "nan_de", "D/E ratio calculated as NaN or from NaN source. (Fail)")
         # else d_e_ratio is None, meaning it couldn't be determined from info or calculation
         return False
 
+@timed_criterion("returns")
 def has_good_returns(financials, balance_sheet, info, symbol, roe_thresh=ROE_THRESHOLD, roce_thresh=ROCE_THRESHOLD):
     """Checks if ROE and ROCE are above their respective thresholds."""
     if financials is None or financials.empty or balance_sheet is None or balance_sheet.empty:
-        print(f"  - {symbol} | Returns: Financials or Balance Sheet data not available.")
+        _report(symbol, "Returns", "no_statements", "Financials or Balance Sheet data not available.")
         return False
 
     roe = None
@@ -216,22 +361,22 @@ def has_good_returns(financials, balance_sheet, info, symbol, roe_thresh=ROE_THR
             if pd.notna(shareholder_equity) and shareholder_equity != 0 and pd.notna(net_income):
                 roe = net_income / shareholder_equity
             elif shareholder_equity == 0:
-                print(f"  - {symbol} | ROE: Shareholder Equity is zero, cannot calculate ROE.")
+                _diagnose(symbol, "ROE", "zero_equity", "Shareholder Equity is zero, cannot calculate ROE.")
             elif pd.isna(shareholder_equity) or pd.isna(net_income):
-                print(f"  - {symbol} | ROE: Net Income or Shareholder Equity is NaN.")
+                _diagnose(symbol, "ROE", "nan_inputs", "Net Income or Shareholder Equity is NaN.")
 
         except (KeyError, IndexError) as e:
-            print(f"  - {symbol} | ROE: Could not calculate ROE (missing data): {e}")
+            _diagnose(symbol, "ROE", "missing_data", "Could not calculate ROE (missing data): {}", e)
         except Exception as e:
-            print(f"  - {symbol} | ROE: Error calculating ROE: {e}")
+            _diagnose(symbol, "ROE", "error", "Error calculating ROE: {}", e)
 
     if roe is None or pd.isna(roe) or roe <= roe_thresh:
         if roe is not None and not pd.isna(roe):
-            print(f"  - {symbol} | Returns: ROE ({roe:.2%}) is not > {roe_thresh:.0%}. (ROE Fail)")
+            _report(symbol, "Returns", "low_roe", "ROE ({:.2%}) is not > {:.0%}. (ROE Fail)", roe, roe_thresh)
         elif pd.isna(roe):
-            print(f"  - {symbol} | Returns: ROE is NaN. (ROE Fail)")
+            _report(symbol, "Returns", "nan_roe", "ROE is NaN. (ROE Fail)")
         else: # roe is None
-            print(f"  - {symbol} | Returns: ROE could not be determined. (ROE Fail)")
+            _report(symbol, "Returns", "no_roe", "ROE could not be determined. (ROE Fail)")
         return False
 
     roce = None
@@ -265,62 +410,415 @@ def has_good_returns(financials, balance_sheet, info, symbol, roe_thresh=ROE_THR
         if pd.notna(ebit) and capital_employed is not None and capital_employed != 0 and pd.notna(capital_employed):
             roce = ebit / capital_employed
         elif capital_employed == 0 :
-             print(f"  - {symbol} | ROCE: Calculated Capital Employed is zero. Cannot calculate ROCE.")
+             _diagnose(symbol, "ROCE", "zero_capital_employed", "Calculated Capital Employed is zero. Cannot calculate ROCE.")
         elif pd.isna(ebit):
-            print(f"  - {symbol} | ROCE: EBIT is NaN. Cannot calculate ROCE.")
+            _diagnose(symbol, "ROCE", "nan_ebit", "EBIT is NaN. Cannot calculate ROCE.")
         elif capital_employed is not None and pd.isna(capital_employed):
-             print(f"  - {symbol} | ROCE: Capital Employed calculated as NaN. Cannot calculate ROCE.")
+             _diagnose(symbol, "ROCE", "nan_capital_employed", "Capital Employed calculated as NaN. Cannot calculate ROCE.")
         else: 
-            print(f"  - {symbol} | ROCE: Could not determine valid Capital Employed or EBIT for ROCE.")
+            _diagnose(symbol, "ROCE", "no_capital_employed", "Could not determine valid Capital Employed or EBIT for ROCE.")
 
     except (KeyError, IndexError) as e:
-        print(f"  - {symbol} | ROCE: Missing data for ROCE (e.g., EBIT, BS items): {e}")
+        _diagnose(symbol, "ROCE", "missing_data", "Missing data for ROCE (e.g., EBIT, BS items): {}", e)
     except Exception as e:
-        print(f"  - {symbol} | ROCE: Error calculating ROCE: {e}")
+        _diagnose(symbol, "ROCE", "error", "Error calculating ROCE: {}", e)
 
     if roce is None or pd.isna(roce) or roce <= roce_thresh:
         if roce is not None and not pd.isna(roce):
-            print(f"  - {symbol} | Returns: ROCE ({roce:.2%}) is not > {roce_thresh:.0%}. (ROCE Fail)")
+            _report(symbol, "Returns", "low_roce", "ROCE ({:.2%}) is not > {:.0%}. (ROCE Fail)", roce, roce_thresh)
         elif pd.isna(roce):
-            print(f"  - {symbol} | Returns: ROCE is NaN. (ROCE Fail)")
+            _report(symbol, "Returns", "nan_roce", "ROCE is NaN. (ROCE Fail)")
         else: # roce is None
-            print(f"  - {symbol} | Returns: ROCE could not be determined. (ROCE Fail)")
+            _report(symbol, "Returns", "no_roce", "ROCE could not be determined. (ROCE Fail)")
         return False
     
     return True
 
-def screen_stocks(stock_symbols_with_suffix):
+def _has_no_data(stock, info, financials, balance_sheet):
+    return not stock and not info and (financials is None or financials.empty) and \
+           (balance_sheet is None or balance_sheet.empty)
+
+def _passes_criteria(symbol_ns, info, financials, balance_sheet):
+    """Runs the three criteria in order, stopping at the first failure."""
+    if not is_consistently_profitable(financials, symbol_ns):
+        return False
+    if not has_low_debt(balance_sheet, info, symbol_ns):
+        return False
+    return has_good_returns(financials, balance_sheet, info, symbol_ns)
+
+def screen_stocks(stock_symbols_with_suffix, workers=None, rate=FETCH_RATE, burst=FETCH_BURST,
+                  retries=FETCH_RETRIES, cache=None, lazy=False, criteria_order=None,
+                  journal=None, resume=False, incremental=False):
+    """
+    Screens the symbols and returns those that pass every criterion, in input order.
+    With workers > 1 the data is fetched on a thread pool throttled by a shared token
+    bucket (`rate` requests/sec, `burst` back-to-back) instead of the fixed per-symbol sleeps.
+    An optional FundamentalsCache serves fresh datasets from disk (or everything, in replay mode).
+    With lazy=True each dataset is fetched only when a criterion first needs it, and the
+    criteria run in `criteria_order` (names from CRITERIA), stopping at the first failure;
+    a failed fetch then only blanks that one dataset (see LazyTickerData).
+    With a `journal` file every symbol's outcome is appended as it completes; `resume` skips
+    symbols already journaled and `incremental` only re-evaluates symbols whose data changed.
+    A journal needs every dataset, so it can't be combined with lazy=True.
+    """
+    if journal:
+        if lazy:
+            raise ValueError("lazy fetching can't be combined with a journal, which records every dataset's digest")
+        criteria_order = tuple(criteria_order or CRITERIA_ORDER)
+        journal = ScreenJournal(journal, screening_config(criteria_order))
+        try:
+            return _screen_stocks_journaled(stock_symbols_with_suffix, journal, workers, rate, burst, retries,
+                                            cache, criteria_order, resume, incremental)
+        finally:
+            journal.close()
+    if lazy:
+        return _screen_stocks_lazy(stock_symbols_with_suffix, workers, rate, burst, retries, cache,
+                                   tuple(criteria_order or CRITERIA_ORDER))
+    if workers and workers > 1:
+        return _screen_stocks_concurrent(stock_symbols_with_suffix, workers, rate, burst, retries, cache)
+
     passed_stocks = []
     total_symbols = len(stock_symbols_with_suffix)
     print(f"\nStarting screening for {total_symbols} symbols...\n")
 
     for i, symbol_ns in enumerate(stock_symbols_with_suffix):
-        print(f"--- ({i+1}/{total_symbols}) Processing: {symbol_ns} ---")
+        get_metrics().log("--- ({}/{}) Processing: {} ---", i+1, total_symbols, symbol_ns)
         
-        stock, info, financials, balance_sheet = get_ticker_data(symbol_ns)
-
-        if not stock and not info and (financials is None or financials.empty) and \
-           (balance_sheet is None or balance_sheet.empty):
-            print(f"  - {symbol_ns} | Skipping due to no data from yfinance.")
-            time.sleep(0.2) 
+        fetched = set()
+        stock, info, financials, balance_sheet = get_ticker_data(symbol_ns, cache=cache, fetched=fetched)
+        # Only throttle when this symbol actually went to the network (including failed or empty responses).
+        pause = time.sleep if fetched else (lambda seconds: None)
+
+        if _has_no_data(stock, info, financials, balance_sheet):
+            _report(symbol_ns, "Data", "no_data", "Skipping due to no data from yfinance.")
+            pause(0.2) 
             continue
 
         if not is_consistently_profitable(financials, symbol_ns):
-            time.sleep(1) 
+            pause(1) 
             continue 
 
         if not has_low_debt(balance_sheet, info, symbol_ns):
-            time.sleep(1)
+            pause(1)
             continue
 
         if has_good_returns(financials, balance_sheet, info, symbol_ns):
-            print(f"--- {symbol_ns} QUALIFIED ---")
+            _qualified(symbol_ns)
             passed_stocks.append(symbol_ns)
         
-        time.sleep(1) 
+        pause(1) 
+    return passed_stocks
+
+def _screen_stocks_concurrent(stock_symbols_with_suffix, workers, rate, burst, retries, cache=None):
+    passed_stocks = []
+    total_symbols = len(stock_symbols_with_suffix)
+    print(f"\nStarting screening for {total_symbols} symbols "
+          f"({workers} workers, {rate:g} req/s, burst {burst})...\n")
+
+    limiter = TokenBucket(rate, burst)
+    fetch = partial(get_ticker_data, limiter=limiter, retries=retries, cache=cache)
+    start = time.monotonic()
+
+    # Results come back in input order, so the log and the qualified list match the serial run.
+    for i, (symbol_ns, data) in enumerate(map_concurrent(fetch, stock_symbols_with_suffix, workers)):
+        get_metrics().log("--- ({}/{}) Processing: {} ---", i+1, total_symbols, symbol_ns)
+        stock, info, financials, balance_sheet = data
+
+        if _has_no_data(stock, info, financials, balance_sheet):
+            _report(symbol_ns, "Data", "no_data", "Skipping due to no data from yfinance.")
+            continue
+
+        if _passes_criteria(symbol_ns, info, financials, balance_sheet):
+            _qualified(symbol_ns)
+            passed_stocks.append(symbol_ns)
+
+    print(f"\nFetched {total_symbols} symbols in {time.monotonic() - start:.1f}s.")
     return passed_stocks
 
+def _fetch_panel(stock_symbols_with_suffix, workers, rate, burst, retries, cache, panel_dir=None,
+                 panel_max_age=PANEL_MAX_AGE):
+    """
+    Fetches every symbol and ingests it straight into a compact FundamentalsPanel, dropping the
+    Ticker, info dict and statement frames as soon as their numbers are copied out.
+    With `panel_dir`, a panel saved there for the same symbols less than `panel_max_age`
+    seconds ago is memory-mapped instead of fetching, and a freshly built one is saved there.
+    """
+    if panel_dir and os.path.exists(os.path.join(panel_dir, "symbols.json")):
+        panel = FundamentalsPanel.load(panel_dir)
+        if panel.symbols != list(stock_symbols_with_suffix):
+            print(f"Fundamentals panel '{panel_dir}' is for other symbols; rebuilding.")
+        elif panel.built_at is None:
+            print(f"Fundamentals panel '{panel_dir}' has no recorded build time; rebuilding.")
+        elif panel.age() > panel_max_age:
+            print(f"Fundamentals panel '{panel_dir}' is older than {panel_max_age / DAY:g} days; rebuilding.")
+        else:
+            print(f"Loaded fundamentals panel '{panel_dir}' ({len(panel)} symbols, memory-mapped, "
+                  f"{panel.age() / DAY:.1f} days old).")
+            return panel
+        del panel  # Release the memory maps before save() overwrites the files
+    limiter = TokenBucket(rate, burst) if workers and workers > 1 else None
+    fetch = partial(get_ticker_data, limiter=limiter, retries=retries, cache=cache)
+    builder = PanelBuilder()
+    for symbol_ns, (_, info, financials, balance_sheet) in map_concurrent(fetch, stock_symbols_with_suffix, workers):
+        builder.add(symbol_ns, info, financials, balance_sheet)
+    panel = builder.build()
+    if panel_dir:
+        panel.save(panel_dir)
+    return panel
+
+def screen_stocks_vectorized(stock_symbols_with_suffix, workers=None, rate=FETCH_RATE, burst=FETCH_BURST,
+                             retries=FETCH_RETRIES, cache=None, panel_dir=None, panel_max_age=PANEL_MAX_AGE):
+    """
+    Same result as screen_stocks, but evaluates all criteria for all symbols at once on a
+    FundamentalsPanel. Returns (qualified symbols, per-symbol metrics DataFrame).
+    """
+    total_symbols = len(stock_symbols_with_suffix)
+    start = time.monotonic()
+    panel = _fetch_panel(stock_symbols_with_suffix, workers, rate, burst, retries, cache, panel_dir, panel_max_age)
+    built = time.monotonic()
+    metrics = screen_panel(panel, YEARS_FOR_PROFITABILITY, DEBT_TO_EQUITY_THRESHOLD, ROE_THRESHOLD, ROCE_THRESHOLD)
+    done = time.monotonic()
+
+    print(f"\nScreened {total_symbols} symbols: fetch and panel build {built - start:.2f}s, "
+          f"screening {(done - built) * 1000:.1f}ms.")
+    print(f"Failed: profitability {int((~metrics['profitable']).sum())}, "
+          f"debt {int((metrics['profitable'] & ~metrics['low_debt']).sum())}, "
+          f"returns {int((metrics['profitable'] & metrics['low_debt'] & ~metrics['good_returns']).sum())}.")
+    return metrics.index[metrics["qualified"]].tolist(), metrics
+
+def screen_stocks_multi(stock_symbols_with_suffix, screens, years=YEARS_FOR_PROFITABILITY, workers=None,
+                       rate=FETCH_RATE, burst=FETCH_BURST, retries=FETCH_RETRIES, cache=None, panel_dir=None,
+                       panel_max_age=PANEL_MAX_AGE):
+    """
+    Runs several named screens ({name: expression over compute_metrics columns}, see
+    screen_rules) over one fetch and one metric table. Returns {screen name: qualified symbols}.
+    """
+    start = time.monotonic()
+    panel = _fetch_panel(stock_symbols_with_suffix, workers, rate, burst, retries, cache, panel_dir, panel_max_age)
+    fetched = time.monotonic()
+    metrics = compute_metrics(panel, years)
+    compiled = compile_screens(screens, metrics.columns)
+    computed = time.monotonic()
+    results = run_screens(compiled, metrics)
+    done = time.monotonic()
+
+    print(f"\nScreened {len(stock_symbols_with_suffix)} symbols with {len(compiled)} screens: "
+          f"fetch {fetched - start:.2f}s, metrics {computed - fetched:.3f}s, screens {(done - computed) * 1000:.1f}ms.")
+    return {name: results.index[results[name].to_numpy()].tolist() for name in results.columns}
+
+def backtest_screen(stock_symbols_with_suffix, max_dates=None, workers=None, rate=FETCH_RATE, burst=FETCH_BURST,
+                    retries=FETCH_RETRIES, cache=None, panel_dir=None,
+                    panel_max_age=PANEL_MAX_AGE):
+    """
+    Replays the screen at every past rebalance date (fiscal year end + reporting lag) from one
+    fetch of the multi-year statements, scoring each qualifying set on forward price returns.
+    Returns (per-date summary DataFrame, {date: qualified symbols}); see screen_backtest.
+    """
+    start = time.monotonic()
+    panel = _fetch_panel(stock_symbols_with_suffix, workers, rate, burst, retries, cache, panel_dir, panel_max_age)
+    fetched = time.monotonic()
+    closes = load_closes(stock_symbols_with_suffix)
+    priced = time.monotonic()
+    summary, qualified_sets = backtest(panel, closes, YEARS_FOR_PROFITABILITY, DEBT_TO_EQUITY_THRESHOLD,
+                                       ROE_THRESHOLD, ROCE_THRESHOLD)
+    if max_dates:
+        summary = summary.iloc[-max_dates:]
+        qualified_sets = {date: qualified_sets[date] for date in summary.index}
+    done = time.monotonic()
+
+    print(f"\nBacktested {len(stock_symbols_with_suffix)} symbols over {len(summary)} dates: "
+          f"fundamentals {fetched - start:.2f}s, prices {priced - fetched:.2f}s, screening {(done - priced) * 1000:.1f}ms.")
+    return summary, qualified_sets
+
+# --- Lazy Screening ---
+def _info_has_debt_to_equity(info):
+    return bool(info) and info.get('debtToEquity') is not None and not pd.isna(info['debtToEquity'])
+
+def _check_debt(data):
+    info = data.info
+    # has_low_debt only reads the balance sheet when info has no usable D/E.
+    balance_sheet = None if _info_has_debt_to_equity(info) else data.balance_sheet
+    return has_low_debt(balance_sheet, info, data.symbol)
+
+# Each check reads only what it needs from a LazyTickerData, in this order of access.
+CRITERIA = {
+    "profitability": lambda data: is_consistently_profitable(data.financials, data.symbol),
+    "debt": _check_debt,
+    "returns": lambda data: has_good_returns(data.financials, data.balance_sheet, data.info, data.symbol),
+}
+# Cheapest/most selective first: most symbols fail profitability, which needs financials only.
+CRITERIA_ORDER = ("profitability", "debt", "returns")
+
+def _screen_symbol_lazy(symbol_ns, criteria_order, limiter, retries, cache):
+    data = LazyTickerData(symbol_ns, limiter=limiter, retries=retries, cache=cache)
+    passed = all(CRITERIA[name](data) for name in criteria_order)
+    return passed, data.datasets_loaded, data.datasets_fetched
+
+def _screen_stocks_lazy(stock_symbols_with_suffix, workers, rate, burst, retries, cache, criteria_order):
+    unknown = [name for name in criteria_order if name not in CRITERIA]
+    if unknown:
+        raise ValueError(f"Unknown criteria {unknown}; choose from {list(CRITERIA)}")
+
+    passed_stocks = []
+    total_symbols = len(stock_symbols_with_suffix)
+    print(f"\nStarting lazy screening for {total_symbols} symbols "
+          f"(criteria order: {', '.join(criteria_order)})...\n")
+
+    limiter = TokenBucket(rate, burst)
+    screen_one = partial(_screen_symbol_lazy, criteria_order=criteria_order, limiter=limiter,
+                         retries=retries, cache=cache)
+    loaded = fetched = 0
+    # With several workers the criteria run inside the pool, so their log lines may interleave;
+    # each line carries its symbol and the qualified list is still collected in input order.
+    for i, (symbol_ns, (passed, datasets_loaded, datasets_fetched)) in enumerate(
+            map_concurrent(screen_one, stock_symbols_with_suffix, workers)):
+        get_metrics().log("--- ({}/{}) Processed: {} ---", i+1, total_symbols, symbol_ns)
+        loaded += datasets_loaded
+        fetched += datasets_fetched
+        if passed:
+            _qualified(symbol_ns)
+            passed_stocks.append(symbol_ns)
+
+    eager = total_symbols * len(TICKER_DATASETS)
+    if eager:
+        print(f"\nLazy fetching loaded {loaded} of {eager} datasets "
+              f"({eager - loaded} datasets skipped, {(eager - loaded) / eager:.0%}); "
+              f"{fetched} network requests, the rest served from the cache.")
+    return passed_stocks
+
+# --- Journaled Screening (checkpoint/resume) ---
+TickerData = namedtuple("TickerData", ["symbol", "info", "financials", "balance_sheet"])
+
+def screening_config(criteria_order=CRITERIA_ORDER):
+    """Everything that affects a symbol's result; journal entries from a different config are ignored."""
+    return {
+        "years": YEARS_FOR_PROFITABILITY,
+        "debt_to_equity": DEBT_TO_EQUITY_THRESHOLD,
+        "roe": ROE_THRESHOLD,
+        "roce": ROCE_THRESHOLD,
+        "criteria_order": list(criteria_order),
+    }
+
+def _fetch_for_journal(symbol_ns, limiter, retries, cache):
+    """Like get_ticker_data, but returns (data, error) so fetch failures aren't journaled as done."""
+    try:
+        _, info, financials, balance_sheet = retry_call(
+            _fetch_ticker_data, symbol_ns, limiter, cache, retries=retries, backoff=FETCH_BACKOFF)
+        return TickerData(symbol_ns, info, financials, balance_sheet), None
+    except Exception as e:
+        return None, e
+
+def _symbol_metrics(data):
+    """The panel metrics for one symbol as JSON-friendly values (NaN becomes None)."""
+    row = compute_metrics(build_panel([data]), YEARS_FOR_PROFITABILITY).iloc[0]
+    metrics = {}
+    for key, value in row.items():
+        value = value.item() if hasattr(value, "item") else value
+        metrics[key] = None if isinstance(value, float) and math.isnan(value) else value
+    return metrics
+
+def _screen_stocks_journaled(stock_symbols_with_suffix, journal, workers, rate, burst, retries, cache,
+                             criteria_order, resume=False, incremental=False):
+    passed = {}
+    total_symbols = len(stock_symbols_with_suffix)
+    todo = stock_symbols_with_suffix
+    if resume:
+        todo = [s for s in stock_symbols_with_suffix if not journal.completed(s)]
+        for symbol_ns in stock_symbols_with_suffix:
+            entry = journal.completed(symbol_ns)
+            if entry and entry["qualified"]:
+                passed[symbol_ns] = True
+        print(f"\nResuming: {total_symbols - len(todo)} symbols already journaled, {len(todo)} to go.")
+    print(f"\nStarting journaled screening for {len(todo)} symbols (journal: {journal.path})...\n")
+
+    limiter = TokenBucket(rate, burst)
+    fetch = partial(_fetch_for_journal, limiter=limiter, retries=retries, cache=cache)
+    reused = errors = 0
+    for i, (symbol_ns, (data, error)) in enumerate(map_concurrent(fetch, todo, workers)):
+        get_metrics().log("--- ({}/{}) Processing: {} ---", i+1, len(todo), symbol_ns)
+        if error is not None:
+            _report(symbol_ns, "Data", "fetch_error", "Fetch failed, will be retried on --resume: {}", error)
+            journal.record(symbol_ns, "error")
+            errors += 1
+            continue
+
+        inputs = screening_inputs(data.info, data.financials, data.balance_sheet)
+        digests = {name: dataset_digest(inputs[name]) for name in TICKER_DATASETS}
+        entry = journal.unchanged(symbol_ns, digests) if incremental else None
+        if entry:
+            reused += 1
+            if entry["qualified"]:
+                _qualified(symbol_ns, " (unchanged since last run)")
+                passed[symbol_ns] = True
+            continue
+
+        if _has_no_data(None, data.info, data.financials, data.balance_sheet):
+            _report(symbol_ns, "Data", "no_data", "Skipping due to no data from yfinance.")
+            journal.record(symbol_ns, "no_data", digests=digests)
+            continue
+
+        criteria = {}
+        for name in criteria_order:
+            criteria[name] = bool(CRITERIA[name](data))
+            if not criteria[name]:
+                break
+        qualified = len(criteria) == len(criteria_order) and all(criteria.values())
+        if qualified:
+            _qualified(symbol_ns)
+            passed[symbol_ns] = True
+        journal.record(symbol_ns, "ok", criteria, _symbol_metrics(data), digests, qualified)
+
+    if incremental:
+        print(f"\n{reused} symbols unchanged since the last journaled run were not re-evaluated.")
+    if errors:
+        print(f"{errors} symbols failed to fetch; re-run with --resume to retry just those.")
+    return [s for s in stock_symbols_with_suffix if s in passed]
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="NSE fundamental stock screener")
+    parser.add_argument("--workers", type=int, default=1,
+                        help=f"concurrent fetch workers (1 = serial; try {FETCH_WORKERS})")
+    parser.add_argument("--rate", type=float, default=FETCH_RATE, help="yfinance requests per second")
+    parser.add_argument("--burst", type=int, default=FETCH_BURST, help="token bucket burst size")
+    parser.add_argument("--retries", type=int, default=FETCH_RETRIES, help="retries per symbol")
+    parser.add_argument("--cache", action="store_true", help="cache fundamentals on disk between runs")
+    parser.add_argument("--cache-file", default=CACHE_FILENAME, help="SQLite file used by --cache/--replay")
+    parser.add_argument("--replay", action="store_true",
+                        help="offline: serve everything from the cache, never hit the network")
+    parser.add_argument("--lazy", action="store_true",
+                        help="fetch each dataset only when a criterion needs it")
+    parser.add_argument("--criteria-order", default=",".join(CRITERIA_ORDER),
+                        help=f"comma-separated order for --lazy (from: {', '.join(CRITERIA)})")
+    parser.add_argument("--journal", nargs="?", const=JOURNAL_FILENAME, default=None,
+                        help=f"write a per-symbol progress journal (default file: {JOURNAL_FILENAME})")
+    parser.add_argument("--resume", action="store_true", help="skip symbols already completed in the journal")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only re-evaluate symbols whose data changed since the journaled run")
+    parser.add_argument("--quiet", action="store_true",
+                        help="no per-symbol output; messages are only formatted for --events")
+    parser.add_argument("--events", metavar="FILE", help="append a JSON-lines event per rejection, diagnostic or qualification")
+    parser.add_argument("--fixtures", metavar="DIR",
+                        help="screen the synthetic data in DIR (see data_providers.generate_fixtures) instead of yfinance")
+    parser.add_argument("--vectorized", action="store_true",
+                        help="evaluate all criteria at once on a symbol x year panel (no per-symbol log)")
+    parser.add_argument("--panel", metavar="DIR",
+                        help="with --vectorized/--screens/--backtest: reuse (memory-map) or save the fundamentals panel in DIR")
+    parser.add_argument("--panel-max-age", type=float, default=PANEL_MAX_AGE / DAY, metavar="DAYS",
+                        help="rebuild a saved --panel older than this (default: %(default)g, the statement cache TTL)")
+    parser.add_argument("--backtest", nargs="?", type=int, const=0, default=None, metavar="N",
+                        help="replay the screen at past fiscal-year rebalance dates (optionally only the last N)")
+    parser.add_argument("--screens", metavar="FILE",
+                        help="run every screen defined in the JSON FILE (e.g. screens.json) over one fetch")
+    args = parser.parse_args()
+    if args.lazy and (args.journal or args.resume or args.incremental):
+        parser.error("--lazy can't be combined with --journal/--resume/--incremental "
+                     "(the journal records a digest of every dataset, so all of them are fetched)")
+    return args
+
 if __name__ == "__main__":
+    args = parse_args()
+    events_file = open(args.events, "a", encoding="utf-8") if args.events else None
+    metrics = set_metrics(ScreenerMetrics(quiet=args.quiet, sink=events_file))
     print("="*50)
     print("NSE Stock Screener")
     print("="*50)
@@ -329,8 +827,13 @@ if __name__ == "__main__":
     print(f"3. Good Returns (ROE > {ROE_THRESHOLD*100:.0f}% AND ROCE > {ROCE_THRESHOLD*100:.0f}%)")
     print("-" * 30)
 
-    # Now primarily uses CSV
-    base_symbols = get_index_symbols_from_csv(index_name=NIFTY_INDEX_NAME, csv_filename=CSV_FILENAME)
+    if args.fixtures:
+        provider = set_provider(LocalFixtureProvider(args.fixtures))
+        print(f"Using local fixture data from '{args.fixtures}' ({len(provider.symbols)} symbols).")
+        base_symbols = [s[:-3] for s in provider.symbols]
+    else:
+        # Now primarily uses CSV
+        base_symbols = get_index_symbols_from_csv(index_name=NIFTY_INDEX_NAME, csv_filename=CSV_FILENAME)
     
     if base_symbols:
         nse_symbols_with_suffix = [
@@ -351,12 +854,62 @@ if __name__ == "__main__":
             # --- --- --- --- --- --- --- --- --- ---
             nse_symbols_to_screen = nse_symbols_with_suffix
 
-            qualified_stocks = screen_stocks(nse_symbols_to_screen)
+            cache = None
+            if args.cache or args.replay:
+                cache = FundamentalsCache(args.cache_file, offline=args.replay)
+                print(f"Using fundamentals cache '{args.cache_file}'{' in offline replay mode' if args.replay else ''}.")
+
+            screen_results = backtest_summary = None
+            panel_max_age = args.panel_max_age * DAY
+            if args.backtest is not None:
+                backtest_summary, screen_results = backtest_screen(nse_symbols_to_screen, max_dates=args.backtest,
+                                                                   workers=args.workers, rate=args.rate,
+                                                                   burst=args.burst, retries=args.retries, cache=cache,
+                                                                   panel_dir=args.panel, panel_max_age=panel_max_age)
+                qualified_stocks = []
+            elif args.screens:
+                screens, screen_years = load_screens(args.screens)
+                screen_results = screen_stocks_multi(nse_symbols_to_screen, screens,
+                                                     years=screen_years or YEARS_FOR_PROFITABILITY,
+                                                     workers=args.workers, rate=args.rate, burst=args.burst,
+                                                     retries=args.retries, cache=cache,
+                                                     panel_dir=args.panel, panel_max_age=panel_max_age)
+                qualified_stocks = []
+            elif args.vectorized:
+                qualified_stocks, _ = screen_stocks_vectorized(nse_symbols_to_screen, workers=args.workers,
+                                                               rate=args.rate, burst=args.burst,
+                                                               retries=args.retries, cache=cache,
+                                                               panel_dir=args.panel, panel_max_age=panel_max_age)
+            else:
+                qualified_stocks = screen_stocks(nse_symbols_to_screen, workers=args.workers, rate=args.rate,
+                                                 burst=args.burst, retries=args.retries, cache=cache,
+                                                 lazy=args.lazy, criteria_order=[c.strip() for c in args.criteria_order.split(",")],
+                                                 journal=args.journal or ((args.resume or args.incremental) and JOURNAL_FILENAME),
+                                                 resume=args.resume, incremental=args.incremental)
+            if cache:
+                print(cache.summary())
+                cache.close()
+            print("\n" + metrics.summary())
+            if events_file:
+                events_file.close()
 
             print("\n" + "=" * 30)
             print("SCREENING COMPLETE")
             print("=" * 30)
-            if qualified_stocks:
+            if backtest_summary is not None:
+                print("\nForward returns (%) of each date's qualifying set until the next date:")
+                print(backtest_summary.round(2).to_string())
+                for date, passed in screen_results.items():
+                    print(f"\n{date:%Y-%m-%d}: {len(passed)} stocks qualified")
+                    for stock_symbol in passed:
+                        print(f"- {stock_symbol}")
+            elif screen_results is not None:
+                for name, passed in screen_results.items():
+                    print(f"\n[{name}] {screens[name]}")
+                    print(f"{len(passed)} stocks passed:")
+                    for stock_symbol in passed:
+                        print(f"- {stock_symbol}")
+            elif qualified_stocks:
                 print(f"\n{len(qualified_stocks)} Stocks that passed all criteria:")
                 for stock_symbol in qualified_stocks:
                     print(f"- {stock_symbol}")
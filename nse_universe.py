@@ -0,0 +1,109 @@
+import json
+import os
+import pickle
+import time
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+EQUITY_L_URL = "https://archives.nseindia.com/content/equities/EQUITY_L.csv"
+EQUITY_L_FILE = "EQUITY_L.csv"
+CHECK_INTERVAL = 6 * 60 * 60 # Don't even ask the server again within this many seconds
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Referer': 'https://www.nseindia.com/'
+}
+
+_session = None
+
+
+def get_session():
+    """One pooled HTTP session (keep-alive, shared headers) for every NSE download."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+    return _session
+
+
+def _write_meta(meta_path, meta):
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+
+def refresh_file(url, path, timeout=30, check_interval=CHECK_INTERVAL):
+    """
+    Keeps `path` as a local copy of `url`, re-downloading only when the server says it changed
+    (If-None-Match / If-Modified-Since from the last response, kept in `path`.meta.json).
+    A copy checked less than `check_interval` seconds ago is used without any request, and the
+    existing copy is used if the server can't be reached. Returns True if it downloaded.
+    """
+    meta_path = path + ".meta.json"
+    meta = {}
+    if os.path.exists(path) and os.path.exists(meta_path):
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        if time.time() - meta.get("checked_at", 0) < check_interval:
+            return False
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        response = get_session().get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304:
+            _write_meta(meta_path, {**meta, "checked_at": time.time()})
+            return False
+        response.raise_for_status()
+    except requests.RequestException:
+        if os.path.exists(path):
+            return False
+        raise
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(response.content)
+    os.replace(tmp, path)
+    _write_meta(meta_path, {"etag": response.headers.get("ETag"),
+                            "last_modified": response.headers.get("Last-Modified"),
+                            "checked_at": time.time()})
+    return True
+
+
+def cached_parse(path, key, parse):
+    """
+    Returns parse(path), memoized on disk in `path`.`key`.pkl and invalidated whenever the
+    source file's mtime or size changes, so warm starts skip CSV parsing entirely.
+    """
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cache_path = f"{path}.{key}.pkl"
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, value = pickle.load(f)
+        if cached_stamp == stamp:
+            return value
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+    value = parse(path)
+    with open(cache_path, "wb") as f:
+        pickle.dump((stamp, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+    return value
+
+
+def _parse_equity_symbols(path):
+    # Only the SYMBOL column is parsed; the C parser streams the rest past.
+    df = pd.read_csv(path, dtype={'SYMBOL': str}, usecols=['SYMBOL'], on_bad_lines='skip')
+    return df['SYMBOL'].tolist()
+
+
+def equity_symbols(path=EQUITY_L_FILE, url=EQUITY_L_URL):
+    """Every row's SYMBOL from NSE's EQUITY_L.csv, refreshed only when the exchange file changed."""
+    refresh_file(url, path)
+    return cached_parse(path, "symbols", _parse_equity_symbols)
@@ -1,14 +1,4 @@
-s = "malayalam"
-i,j = 0, len(s)-1
-is_palindrome = True
-while i<j:
-    if s[i]!=s[j]:
-        is_palindrome=False
-        break
-    i+=1
-    j-=1
+from palindromes import is_palindrome
 
-if is_palindrome:
-    print(True)
-else:
-    print(False)
\ No newline at end of file
+s = "malayalam"
+print(is_palindrome(s))
\ No newline at end of file
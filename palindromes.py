@@ -0,0 +1,118 @@
+"""
+Palindrome checks over large inputs and linear-time palindromic-substring queries.
+
+    python palindromes.py lines corpus.txt --normalize
+    python palindromes.py longest genome.txt
+
+Whole strings are checked with one C-level slice comparison (s == s[::-1]), or, for an
+array of strings at once, as a padded code-point matrix compared against its row-wise reversal.
+The longest palindromic substring and the number of palindromic substrings come from
+Manacher's algorithm in O(n).
+"""
+import argparse
+import sys
+
+import numpy as np
+
+
+def normalize(text, casefold=True, alnum_only=True):
+    """Lower-cases and/or keeps only letters and digits, e.g. 'A man, a plan' -> 'amanaplan'."""
+    if casefold:
+        text = text.casefold()
+    if alnum_only:
+        text = "".join(filter(str.isalnum, text))
+    return text
+
+
+def is_palindrome(text, normalized=False):
+    if normalized:
+        text = normalize(text)
+    return text == text[::-1]
+
+
+def check_lines(lines, normalized=False):
+    """Yields is_palindrome for every line of an iterable (trailing newline ignored), lazily."""
+    for line in lines:
+        yield is_palindrome(line.rstrip("\r\n"), normalized)
+
+
+def palindrome_mask(lines):
+    """
+    is_palindrome for a whole array of strings at once (e.g. a NumPy or pandas string
+    column): the strings become one zero-padded code-point matrix, the first half of every
+    row is compared with the row read back from its own length, and a row is a palindrome
+    when all its real positions match. For a Python list, check_lines is about as fast.
+    """
+    matrix = np.asarray(lines, dtype=str)
+    if not matrix.size:
+        return np.zeros(matrix.shape, dtype=bool)
+    width = matrix.dtype.itemsize // 4
+    data = matrix.view(np.uint32).reshape(len(matrix), width)
+    lengths = np.char.str_len(matrix)[:, None]
+    positions = np.arange((width + 1) // 2)
+    mirrored = np.clip(lengths - 1 - positions, 0, width - 1)
+    same = data[:, :len(positions)] == np.take_along_axis(data, mirrored, axis=1)
+    return (same | (positions >= lengths)).all(axis=1)
+
+
+def manacher(text):
+    """
+    Palindrome radii over text with separators between characters ('#a#b#a#'): radius[i]
+    is the length of the longest palindrome of `text` centred at position i of that string.
+    """
+    t = "#" + "#".join(text) + "#" if text else "#"
+    n = len(t)
+    radius = [0] * n
+    center = right = 0
+    for i in range(n):
+        r = min(right - i, radius[2 * center - i]) if i < right else 0
+        while i - r - 1 >= 0 and i + r + 1 < n and t[i - r - 1] == t[i + r + 1]:
+            r += 1
+        radius[i] = r
+        if i + r > right:
+            center, right = i, i + r
+    return radius
+
+
+def longest_palindrome(text):
+    """The longest palindromic substring (the leftmost one on ties), in O(n)."""
+    if not text:
+        return ""
+    radius = manacher(text)
+    best = max(range(len(radius)), key=radius.__getitem__)
+    start = (best - radius[best]) // 2
+    return text[start:start + radius[best]]
+
+
+def count_palindromes(text):
+    """Number of palindromic substrings (by position, so 'aaa' has 6), in O(n)."""
+    return sum((r + 1) // 2 for r in manacher(text))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("mode", choices=("lines", "longest", "count"))
+    parser.add_argument("path", help="input file, or - for stdin")
+    parser.add_argument("--normalize", action="store_true", help="ignore case and non-alphanumerics")
+    args = parser.parse_args()
+
+    source = sys.stdin if args.path == "-" else open(args.path, encoding="utf-8")
+    with source:
+        if args.mode == "lines":
+            total = found = 0
+            for flag in check_lines(source, args.normalize):
+                total += 1
+                found += flag
+            print(f"{found:,} of {total:,} lines are palindromes")
+            return
+        text = source.read().rstrip("\r\n")
+    if args.normalize:
+        text = normalize(text)
+    if args.mode == "longest":
+        print(longest_palindrome(text))
+    else:
+        print(count_palindromes(text))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,6 @@
-n = 5
-for i in range(1, n+1):
-    for j in range(0, n-i+1):
-        print(' ', end='')
-    c=1
-    for j in range(1, i+1):
-        print(' ',c, sep='', end='')
-        c=c*(i-j)//j
-    print()
\ No newline at end of file
+import sys
+
+from binomial import write_triangle
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+write_triangle(n)
\ No newline at end of file
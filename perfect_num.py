@@ -1,11 +1,8 @@
+from divisors import perfect_numbers
+
 def perfect_num(num):
-    for i in range(1,num+1):
-        if (i%2==0):
-            total = 0
-            for j in range(1,i):
-                if (i%j==0):      
-                    total+=j       
-            if (total == i):
-                print(i)
+    # Euclid-Euler: every even perfect number is 2**(p-1) * (2**p - 1) for a Mersenne prime 2**p - 1
+    for n in perfect_numbers(num):
+        print(n)
 
 perfect_num(1000)
\ No newline at end of file
@@ -0,0 +1,155 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+
+def _top_k_indices(values, k):
+    """
+    Indices of the k largest values, largest first; ties go to the lower index, matching a
+    stable sort. np.partition does the selection, so only the k winners get fully sorted.
+    """
+    n = len(values)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.int64)
+    if k >= n:
+        return np.lexsort((np.arange(n), -values))
+    kth = np.partition(values, n - k)[n - k]
+    above = np.flatnonzero(values > kth)
+    ties = np.flatnonzero(values == kth)[:k - len(above)]
+    chosen = np.concatenate([above, ties])
+    return chosen[np.lexsort((chosen, -values[chosen]))]
+
+
+def adjacent_gaps(prices, decimals=2):
+    """
+    Sorts prices high to low (stable) and returns (order, gaps) where gaps[i] is the % drop
+    from the i-th to the (i+1)-th highest price: (high - low) / high * 100.
+    """
+    prices = np.asarray(prices, dtype=float)
+    order = np.argsort(-prices, kind="stable")
+    ranked = prices[order]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gaps = (ranked[:-1] - ranked[1:]) / ranked[:-1] * 100
+    if decimals is not None:
+        gaps = np.round(gaps, decimals)
+    return order, gaps
+
+
+def _py(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def top_gaps(prices, names=None, k=3, decimals=2):
+    """
+    The k largest adjacent-pair percentage gaps in a set of prices, as
+    [(higher name, lower name, gap %), ...] largest first. `names` defaults to positions.
+    NaN prices are dropped and pairs whose higher price is 0 have no gap, as in
+    top_gaps_from_file. One sort for the ranking, one partial selection for the top k.
+    """
+    prices = np.asarray(prices, dtype=float)
+    names = np.arange(len(prices)) if names is None else np.asarray(names)
+    present = ~np.isnan(prices)
+    prices, names = prices[present], names[present]
+    order, gaps = adjacent_gaps(prices, decimals)
+    defined = np.flatnonzero(prices[order[:-1]] != 0)
+    top = defined[_top_k_indices(gaps[defined], k)]
+    return [(_py(names[order[i]]), _py(names[order[i + 1]]), _py(gaps[i])) for i in top]
+
+
+def _sorted_runs(path, name_col, price_col, chunk_rows, tmpdir):
+    """Sorts the file chunk by chunk (high to low) into .npy runs on disk; yields run paths."""
+    for n, chunk in enumerate(pd.read_csv(path, usecols=[name_col, price_col], chunksize=chunk_rows)):
+        chunk = chunk.dropna(subset=[price_col])
+        prices = chunk[price_col].to_numpy(dtype=float)
+        names = chunk[name_col].astype(str).to_numpy(dtype=str)
+        order = np.argsort(-prices, kind="stable")
+        run = os.path.join(tmpdir, f"run{n:05d}")
+        np.save(run + ".prices.npy", prices[order])
+        np.save(run + ".names.npy", names[order])
+        yield run
+
+
+def _merge_runs(runs, block=65536):
+    """
+    Yields (prices, names) blocks of all runs k-way merged high to low, stable by run then
+    position. Each step takes, from every run's buffered rows, those priced above the lowest
+    buffered price of the run that sets the bound (the highest such price over runs with rows
+    still on disk) - nothing left on disk can outrank them - and orders them with one stable
+    argsort, so the merge runs at NumPy speed instead of one heap operation per row.
+    """
+    sources = [(np.load(run + ".prices.npy", mmap_mode="r"), np.load(run + ".names.npy", mmap_mode="r"))
+               for run in runs]
+    offsets = [0] * len(sources)
+    buffered = [(np.empty(0), np.empty(0, dtype=str)) for _ in sources]
+
+    def load(r):
+        prices, names = sources[r]
+        start = offsets[r]
+        offsets[r] = min(start + block, len(prices))
+        buffered[r] = (np.concatenate([buffered[r][0], prices[start:offsets[r]]]),
+                       np.concatenate([buffered[r][1], names[start:offsets[r]]]))
+
+    while True:
+        on_disk = [r for r in range(len(sources)) if offsets[r] < len(sources[r][0])]
+        for r in on_disk:
+            if not len(buffered[r][0]):
+                load(r)
+        if not on_disk:
+            cuts = [len(p) for p, _ in buffered]
+        else:
+            bound_run = max(on_disk, key=lambda r: buffered[r][0][-1])
+            bound = buffered[bound_run][0][-1]
+            cuts = [np.searchsorted(-p, -bound, side="left") for p, _ in buffered]
+            if not sum(cuts):
+                load(bound_run)
+                continue
+        if not sum(cuts):
+            return
+        prices = np.concatenate([p[:c] for (p, _), c in zip(buffered, cuts)])
+        names = np.concatenate([n[:c] for (_, n), c in zip(buffered, cuts)])
+        buffered = [(p[c:], n[c:]) for (p, n), c in zip(buffered, cuts)]
+        order = np.argsort(-prices, kind="stable")  # runs were concatenated in order
+        yield prices[order], names[order]
+
+
+def top_gaps_from_file(path, k=3, name_col="name", price_col="price", chunk_rows=1_000_000, decimals=2):
+    """
+    top_gaps over a CSV too large for memory: each chunk is sorted into a run on disk, the runs
+    are k-way merged in price order block by block, and the top k gaps of each block are folded
+    into the best k so far, so memory is bounded by one chunk while sorting, then one block
+    per run plus k entries, however long the file is.
+    """
+    tmpdir = tempfile.mkdtemp(prefix="price_gaps_")
+    try:
+        runs = list(_sorted_runs(path, name_col, price_col, chunk_rows, tmpdir))
+        best_gaps, best_pairs = np.empty(0), np.empty(0, dtype=np.int64)
+        best_high, best_low = np.empty(0, dtype=str), np.empty(0, dtype=str)
+        seen = 0  # rows merged before the current block
+        previous = None  # (price, name) of the last merged row
+        for prices, names in _merge_runs(runs):
+            first_pair = seen
+            if previous is not None:
+                prices = np.concatenate([[previous[0]], prices])
+                names = np.concatenate([[previous[1]], names])
+                first_pair -= 1
+            seen += len(prices) - (previous is not None)
+            previous = (prices[-1], names[-1])
+            high, low = prices[:-1], prices[1:]
+            defined = np.flatnonzero(high != 0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                gaps = (high[defined] - low[defined]) / high[defined] * 100
+            if decimals is not None:
+                gaps = np.round(gaps, decimals)
+            all_gaps = np.concatenate([best_gaps, gaps])
+            all_pairs = np.concatenate([best_pairs, first_pair + defined])
+            all_high = np.concatenate([best_high, names[:-1][defined]])
+            all_low = np.concatenate([best_low, names[1:][defined]])
+            keep = np.lexsort((all_pairs, -all_gaps))[:k] if k > 0 else []
+            best_gaps, best_pairs = all_gaps[keep], all_pairs[keep]
+            best_high, best_low = all_high[keep], all_low[keep]
+        return [(str(high), str(low), float(gap)) for high, low, gap in zip(best_high, best_low, best_gaps)]
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
@@ -0,0 +1,184 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_providers import get_provider, period_start
+
+BAR_DTYPE = np.dtype([
+    ("date", "M8[D]"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("adj_close", "f8"),
+    ("volume", "f8"),
+])
+# yf.download column -> store field
+FIELDS = {"Open": "open", "High": "high", "Low": "low", "Close": "close", "Adj Close": "adj_close", "Volume": "volume"}
+ADJUSTMENT_RTOL = 1e-4  # A re-fetched bar's adjusted close differing by more than this means history was re-adjusted
+
+
+class PriceStore:
+    """
+    Local daily-bar store: one .npy structured array per symbol (sorted by date) plus an
+    index.json of each symbol's last stored date.
+
+    update() downloads only the bars after each symbol's last stored date (re-fetching that
+    last day, which may have been a partial bar, and the complete one before it) and batches
+    symbols that need the same range into one multi-ticker download. If the complete overlap
+    bar's adjusted close no longer matches the stored one, a split, bonus issue or dividend
+    has re-adjusted the whole history, so the symbol's full period is downloaded again instead
+    of appending to stale bars. Reads memory-map the files, so window() returns a view
+    into the page cache rather than a copy.
+    """
+
+    def __init__(self, root="price_store"):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._index_path = os.path.join(root, "index.json")
+        self.last_dates = {}
+        if os.path.exists(self._index_path):
+            with open(self._index_path, encoding="utf-8") as f:
+                self.last_dates = json.load(f)
+
+    def _path(self, symbol):
+        return os.path.join(self.root, f"{symbol}.npy")
+
+    def __contains__(self, symbol):
+        return symbol in self.last_dates
+
+    def bars(self, symbol):
+        """All stored bars for a symbol as a read-only memmap (empty array if unknown)."""
+        if symbol not in self.last_dates:
+            return np.empty(0, dtype=BAR_DTYPE)
+        return np.load(self._path(symbol), mmap_mode="r")
+
+    def window(self, symbol, start=None, end=None):
+        """Bars with start < date <= end, as a zero-copy slice of the memmap."""
+        bars = self.bars(symbol)
+        lo = 0 if start is None else np.searchsorted(bars["date"], np.datetime64(pd.Timestamp(start), "D"), side="right")
+        hi = len(bars) if end is None else np.searchsorted(bars["date"], np.datetime64(pd.Timestamp(end), "D"), side="right")
+        return bars[lo:hi]
+
+    def latest_date(self):
+        return max(self.last_dates.values()) if self.last_dates else None
+
+    def _write(self, symbol, bars):
+        tmp = self._path(symbol) + ".tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, bars)
+        os.replace(tmp, self._path(symbol))
+        self.last_dates[symbol] = str(bars["date"][-1])
+
+    def _save_index(self):
+        tmp = self._index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.last_dates, f)
+        os.replace(tmp, self._index_path)
+
+    def _merge(self, symbol, new_bars):
+        """Appends new bars, replacing any stored bars from the first new date on."""
+        if not len(new_bars):
+            return 0
+        old = np.asarray(self.bars(symbol))
+        keep = old[old["date"] < new_bars["date"][0]]
+        self._write(symbol, np.concatenate([keep, new_bars]))
+        return len(new_bars)
+
+    def _resume_date(self, symbol):
+        """Where a symbol's next download starts: its second-to-last bar, so one complete bar overlaps."""
+        if symbol not in self.last_dates:
+            return None
+        dates = self.bars(symbol)["date"]
+        return str(dates[-2]) if len(dates) > 1 else self.last_dates[symbol]
+
+    def _readjusted(self, symbol, new_bars):
+        """True when a re-fetched complete bar's adjusted close differs from the stored one."""
+        old = self.bars(symbol)
+        if not len(old):
+            return False
+        complete = old[old["date"] < old["date"][-1]]  # the last stored bar may have been partial
+        _, i, j = np.intersect1d(complete["date"], new_bars["date"], assume_unique=True, return_indices=True)
+        return not np.allclose(complete["adj_close"][i], new_bars["adj_close"][j], rtol=ADJUSTMENT_RTOL, atol=0)
+
+    def _download(self, symbols, batch_size, **kwargs):
+        """Yields (symbol, bars) for every symbol yf.download returns, batch_size tickers per call."""
+        for i in range(0, len(symbols), batch_size):
+            chunk = symbols[i:i + batch_size]
+            try:
+                data = get_provider().download(chunk, progress=False, threads=True, auto_adjust=False,
+                                               group_by="column", **kwargs)
+            except Exception as e:
+                print(f"Price store: download failed for {len(chunk)} symbols from {next(iter(kwargs.values()))}: {e}")
+                continue
+            yield from _split_bars(data, chunk).items()
+
+    def update(self, symbols, period="1y", batch_size=200):
+        """
+        Brings every symbol up to date: unknown symbols get `period` of history, known ones
+        only the tail since their last stored date, and re-adjusted ones `period` again.
+        Returns the number of bars downloaded.
+        """
+        groups = {}
+        for symbol in symbols:
+            groups.setdefault(self._resume_date(symbol), []).append(symbol)
+
+        downloaded = 0
+        readjusted = []
+        for start, group in groups.items():
+            kwargs = {"period": period} if start is None else {"start": start}
+            for symbol, bars in self._download(group, batch_size, **kwargs):
+                if start is not None and self._readjusted(symbol, bars):
+                    readjusted.append(symbol)
+                    continue
+                downloaded += self._merge(symbol, bars)
+        if readjusted:
+            print(f"Price store: {len(readjusted)} symbols re-adjusted (split, bonus or dividend); "
+                  f"re-downloading {period}")
+            for symbol, bars in self._download(readjusted, batch_size, period=period):
+                self._write(symbol, bars)
+                downloaded += len(bars)
+        self._save_index()
+        return downloaded
+
+    def frame(self, symbols, field="adj_close", start=None, end=None):
+        """A dates x symbols DataFrame of one field over a window, for cross-sectional scans."""
+        columns = {}
+        for symbol in symbols:
+            bars = self.window(symbol, start, end)
+            if len(bars):
+                columns[symbol] = pd.Series(bars[field], index=pd.DatetimeIndex(bars["date"]))
+        return pd.DataFrame(columns).reindex(columns=list(symbols))
+
+    def period_frames(self, symbols, period="6mo", fields=("adj_close", "volume")):
+        """Frames for a yf.download-style period ending at the store's latest bar."""
+        end = self.latest_date()
+        start = period_start(end, period) if end else None
+        return [self.frame(symbols, field, start, end) for field in fields]
+
+
+def _split_bars(data, tickers):
+    """Per-ticker BAR_DTYPE arrays (NaN-close rows dropped) from a yf.download result."""
+    if data is None or data.empty:
+        return {}
+    if not isinstance(data.columns, pd.MultiIndex):
+        data = pd.concat({tickers[0]: data}, axis=1).swaplevel(0, 1, axis=1)
+    dates = data.index.to_numpy(dtype="datetime64[D]")
+    present = set(data.columns.get_level_values(0))
+    out = {}
+    for ticker in tickers:
+        if ("Close", ticker) not in data.columns:
+            continue
+        close = data[("Close", ticker)].to_numpy(dtype=float)
+        rows = ~np.isnan(close)
+        if not rows.any():
+            continue
+        bars = np.zeros(rows.sum(), dtype=BAR_DTYPE)
+        bars["date"] = dates[rows]
+        for column, field in FIELDS.items():
+            source = column if column in present else "Close" # auto_adjust=True has no Adj Close
+            bars[field] = data[(source, ticker)].to_numpy(dtype=float)[rows]
+        out[ticker] = bars
+    return out
@@ -1,12 +1,10 @@
+from primes import primes
+
 # def prime_num(num):
 #     if num == 0 or num == 1:
 #         print(num, "is not a prime number")
 #     elif num > 1:
 num = int(input("Enter a number: "))
-for i in range(2,num+1):
-    for j in range(2,num+1):
-        if i%j == 0:
-            break
-    if i == j:
-        print(i,end=',')
+for p in primes(num):
+    print(p,end=',')
 # prime_num(100)
\ No newline at end of file
@@ -1,13 +1,7 @@
-def prime_factors(num):
-    factors = []
-    factor = 2
+from factorization import factorize
 
-    while(num>=2):
-        if (num%factor==0):
-            factors.append(factor)
-            num = num / factor
-        else:
-            factor+=1
-    return factors
+def prime_factors(num):
+    # Trial division, then Miller-Rabin + Pollard-rho; exact for any int (no float division)
+    return factorize(num)
 
 print(prime_factors(42))
\ No newline at end of file
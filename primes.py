@@ -0,0 +1,99 @@
+import math
+
+import numpy as np
+
+SEGMENT_SIZE = 1 << 20  # Odd numbers per sieve segment (1 MiB of bools), so memory stays flat at any limit
+
+# Witnesses that make Miller-Rabin exact for every n < 3.3e24 (Sorenson & Webster, 2015).
+MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+MR_DETERMINISTIC_LIMIT = 3_317_044_064_679_887_385_961_981
+
+
+def small_primes(n):
+    """All primes <= n as a NumPy array, from one odd-only sieve (for base primes and small n)."""
+    if n < 2:
+        return np.empty(0, dtype=np.int64)
+    sieve = np.ones((n + 1) // 2, dtype=bool)  # sieve[k] <-> 2k + 1
+    sieve[0] = False
+    for i in range(1, (math.isqrt(n) - 1) // 2 + 1):
+        if sieve[i]:
+            p = 2 * i + 1
+            sieve[p * p // 2::p] = False
+    return np.concatenate(([2], 2 * np.flatnonzero(sieve) + 1)).astype(np.int64)
+
+
+def prime_segments(limit, start=2, segment_size=SEGMENT_SIZE):
+    """
+    Yields the primes in [start, limit] as NumPy arrays, one sieve segment at a time.
+    Only the base primes up to sqrt(limit) and one segment are ever in memory.
+    """
+    if limit < max(start, 2):
+        return
+    if start <= 2:
+        yield np.array([2], dtype=np.int64)
+        start = 3
+    base = small_primes(math.isqrt(limit))[1:]  # odd base primes
+    lo = start | 1
+    while lo <= limit:
+        hi = min(lo + 2 * segment_size, limit + 1)  # segment covers the odd numbers in [lo, hi)
+        segment = np.ones((hi - lo + 1) // 2, dtype=bool)
+        for p in base[base * base < hi].tolist():
+            first = max(p * p, (lo + p - 1) // p * p)
+            if first % 2 == 0:
+                first += p
+            segment[(first - lo) // 2::p] = False
+        yield lo + 2 * np.flatnonzero(segment)
+        lo = hi if hi % 2 else hi + 1
+
+
+def primes(limit, start=2):
+    """Lazily yields every prime in [start, limit] as a Python int."""
+    for segment in prime_segments(limit, start):
+        yield from segment.tolist()
+
+
+def primes_up_to(n):
+    """All primes <= n as one NumPy array."""
+    segments = list(prime_segments(n))
+    return np.concatenate(segments) if segments else np.empty(0, dtype=np.int64)
+
+
+def prime_mask(n):
+    """Boolean array m of length n + 1 with m[k] True iff k is prime."""
+    mask = np.zeros(max(n, 0) + 1, dtype=bool)
+    mask[primes_up_to(n)] = True
+    return mask
+
+
+def count_primes(n):
+    """pi(n), counted segment by segment in bounded memory (10**9 is fine)."""
+    return sum(len(segment) for segment in prime_segments(n))
+
+
+def is_prime(n):
+    """
+    Primality test for any int: trial division by the small primes, then Miller-Rabin with
+    MR_BASES, which is exact below MR_DETERMINISTIC_LIMIT (a strong probable-prime test above it).
+    """
+    if n < 2:
+        return False
+    for p in MR_BASES:
+        if n % p == 0:
+            return n == p
+    if n < MR_BASES[-1] ** 2:
+        return True  # no prime factor <= 41, so no factor at all
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
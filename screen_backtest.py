@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+
+from data_providers import get_provider
+from nse_panel import REPORTING_LAG, panel_as_of, screen_panel
+
+PRICE_PERIOD = "max"
+PRICE_BATCH_SIZE = 200
+MIN_DATE_COVERAGE = 0.1  # A fiscal year end becomes a rebalance date if this share of symbols uses it
+
+
+def rebalance_dates(panel, lag=REPORTING_LAG, min_coverage=MIN_DATE_COVERAGE):
+    """
+    Dates on which a new fiscal year's statements became available for a meaningful share of
+    the universe: each common fiscal year end plus the reporting lag, oldest first.
+    """
+    dates = pd.Series(panel.fin_dates.ravel()).dropna().dt.normalize()
+    counts = dates.value_counts()
+    common = counts.index[counts >= max(1, min_coverage * len(panel))]
+    return sorted(pd.Timestamp(d) + lag for d in common)
+
+
+def load_closes(symbols, period=PRICE_PERIOD, batch_size=PRICE_BATCH_SIZE):
+    """A dates x symbols frame of adjusted closes, downloaded batch_size tickers at a time."""
+    frames = []
+    for i in range(0, len(symbols), batch_size):
+        chunk = list(symbols[i:i + batch_size])
+        try:
+            data = get_provider().download(chunk, period=period, progress=False, threads=True,
+                                           auto_adjust=False, group_by="column")
+        except Exception as e:
+            print(f"Backtest: price download failed for {len(chunk)} symbols: {e}")
+            continue
+        if data is None or data.empty:
+            continue
+        if not isinstance(data.columns, pd.MultiIndex):
+            data = pd.concat({chunk[0]: data}, axis=1).swaplevel(0, 1, axis=1)
+        field = "Adj Close" if "Adj Close" in data.columns.get_level_values(0) else "Close"
+        frames.append(data[field].reindex(columns=chunk))
+    if not frames:
+        return pd.DataFrame(columns=list(symbols), dtype=float)
+    return pd.concat(frames, axis=1).sort_index().reindex(columns=list(symbols))
+
+
+def forward_returns(closes, dates, horizon=None):
+    """
+    % return of every symbol from each date to the next date (or date + horizon), using the
+    last close at or before each end. A dates x symbols array; NaN where either price is
+    missing or the exit lies past the last bar.
+    """
+    values = closes.ffill().to_numpy(dtype=float)
+    index = closes.index
+    starts = pd.DatetimeIndex(dates)
+    if horizon is None:
+        ends = pd.DatetimeIndex(list(starts[1:]) + [index[-1] if len(index) else starts[-1]])
+    else:
+        ends = pd.DatetimeIndex([d + horizon for d in starts])
+    if not len(index):
+        return np.full((len(starts), closes.shape[1]), np.nan)
+    entry = index.searchsorted(starts, side="right") - 1
+    exit_ = index.searchsorted(ends, side="right") - 1
+    usable = (entry >= 0) & (ends <= index[-1]) & (exit_ > entry)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        returns = (values[np.maximum(exit_, 0)] / values[np.maximum(entry, 0)] - 1) * 100
+    returns[~usable] = np.nan
+    return returns
+
+
+def backtest(panel, closes, years, de_threshold, roe_threshold, roce_threshold, dates=None,
+             lag=REPORTING_LAG, horizon=None):
+    """
+    Evaluates the screen as of every rebalance date from one panel (see panel_as_of) and
+    scores each qualifying set on forward returns from `closes` (dates x symbols).
+    Returns (summary DataFrame indexed by date, {date: qualified symbols}).
+    """
+    dates = rebalance_dates(panel, lag) if dates is None else sorted(pd.Timestamp(d) for d in dates)
+    closes = closes.reindex(columns=panel.symbols)
+    returns = forward_returns(closes, dates, horizon)
+
+    rows, qualified_sets = [], {}
+    for i, date in enumerate(dates):
+        metrics = screen_panel(panel_as_of(panel, date, lag), years, de_threshold, roe_threshold, roce_threshold)
+        qualified = metrics["qualified"].to_numpy()
+        qualified_sets[date] = metrics.index[qualified].tolist()
+        picked = returns[i][qualified]
+        priced = picked[~np.isnan(picked)]
+        universe = returns[i][~np.isnan(returns[i])]
+        mean = priced.mean() if len(priced) else np.nan
+        universe_mean = universe.mean() if len(universe) else np.nan
+        rows.append({
+            "date": date,
+            "qualified": int(qualified.sum()),
+            "priced": len(priced),
+            "mean_return_pct": mean,
+            "median_return_pct": np.median(priced) if len(priced) else np.nan,
+            "universe_return_pct": universe_mean,
+            "excess_pct": mean - universe_mean,
+        })
+    return pd.DataFrame(rows).set_index("date"), qualified_sets
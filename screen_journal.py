@@ -0,0 +1,70 @@
+import json
+import os
+import time
+
+
+class ScreenJournal:
+    """
+    Append-only JSON-lines journal of per-symbol screening results.
+
+    Each line records the symbol, its fetch status ('ok', 'no_data' or 'error'), the result of
+    every criterion that ran, the computed metrics, a digest of each dataset and the screening
+    config. Lines are flushed as they are written, so a crashed run loses at most one symbol;
+    reopening the journal truncates a torn final line before anything is appended.
+    When a symbol appears more than once the latest line wins.
+    """
+
+    DONE_STATUSES = ("ok", "no_data")
+
+    def __init__(self, path, config):
+        self.path = path
+        self.config = config
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, "r+b") as f:
+                data = f.read()
+                complete = data.rfind(b"\n") + 1
+                if complete < len(data):
+                    # A torn last line from a crash; cut it off so the next record starts on its own line.
+                    f.truncate(complete)
+            for line in data[:complete].splitlines():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue # A line damaged some other way
+                self.entries[entry["symbol"]] = entry
+        self._file = open(path, "a", encoding="utf-8")
+
+    def completed(self, symbol):
+        """The journaled entry if the symbol finished under the same config, else None."""
+        entry = self.entries.get(symbol)
+        if entry and entry.get("status") in self.DONE_STATUSES and entry.get("config") == self.config:
+            return entry
+        return None
+
+    def unchanged(self, symbol, digests):
+        """The journaled entry if it was computed from exactly these datasets, else None."""
+        entry = self.completed(symbol)
+        if entry and digests and entry.get("digests") == digests:
+            return entry
+        return None
+
+    def record(self, symbol, status, criteria=None, metrics=None, digests=None, qualified=False):
+        entry = {
+            "symbol": symbol,
+            "status": status,
+            "criteria": criteria or {},
+            "metrics": metrics or {},
+            "digests": digests or {},
+            "qualified": bool(qualified),
+            "config": self.config,
+            "ts": time.time(),
+        }
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.entries[symbol] = entry
+        return entry
+
+    def close(self):
+        self._file.close()
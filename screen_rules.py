@@ -0,0 +1,128 @@
+import ast
+import json
+
+import numpy as np
+import pandas as pd
+
+# Expression syntax accepted in a screen: metric names, numbers, arithmetic, comparisons
+# (chains too), and/or/not, parentheses. Anything else is rejected when the screen is compiled.
+_ALLOWED = (
+    ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not, ast.USub, ast.UAdd,
+    ast.BinOp, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Compare, ast.Lt, ast.LtE, ast.Gt,
+    ast.GtE, ast.Eq, ast.NotEq, ast.Name, ast.Load, ast.Constant,
+)
+
+
+def _truth(value):
+    """Three-valued truth as floats: 1.0 true, 0.0 false, NaN unknown (a NaN metric)."""
+    value = np.asarray(value, dtype=float)
+    return np.where(np.isnan(value), np.nan, value != 0)
+
+
+def _and(*values):
+    truths = np.array(np.broadcast_arrays(*map(_truth, values)))
+    return np.where((truths == 0).any(axis=0), 0.0, np.where(np.isnan(truths).any(axis=0), np.nan, 1.0))
+
+
+def _or(*values):
+    truths = np.array(np.broadcast_arrays(*map(_truth, values)))
+    return np.where((truths == 1).any(axis=0), 1.0, np.where(np.isnan(truths).any(axis=0), np.nan, 0.0))
+
+
+def _not(value):
+    return 1.0 - _truth(value)
+
+
+_COMPARISONS = {
+    "Lt": np.less, "LtE": np.less_equal, "Gt": np.greater,
+    "GtE": np.greater_equal, "Eq": np.equal, "NotEq": np.not_equal,
+}
+
+
+def _compare(op, left, right):
+    left, right = np.asarray(left, dtype=float), np.asarray(right, dtype=float)
+    return np.where(np.isnan(left) | np.isnan(right), np.nan, _COMPARISONS[op](left, right))
+
+
+# Injected as the eval globals of every compiled screen.
+_HELPERS = {"_and": _and, "_or": _or, "_not": _not, "_compare": _compare, "__builtins__": {}}
+
+
+def _call(name, *args):
+    return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=list(args), keywords=[])
+
+
+class _Vectorize(ast.NodeTransformer):
+    """
+    Rewrites scalar boolean logic into elementwise three-valued logic: every and/or/not
+    operand is cast to truth values (nonzero is true) and a comparison involving a NaN
+    metric is unknown, so `not de_ratio > 1` does not pass a symbol with no D/E.
+    """
+
+    def visit_BoolOp(self, node):
+        self.generic_visit(node)
+        return _call("_and" if isinstance(node.op, ast.And) else "_or", *node.values)
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return _call("_not", node.operand)
+        return node
+
+    def visit_Compare(self, node):
+        # a < b < c  ->  (a < b) and (b < c)
+        self.generic_visit(node)
+        parts, left = [], node.left
+        for op, right in zip(node.ops, node.comparators):
+            parts.append(_call("_compare", ast.Constant(type(op).__name__), left, right))
+            left = right
+        return parts[0] if len(parts) == 1 else _call("_and", *parts)
+
+
+class Screen:
+    """One named screen: an expression over metric columns compiled to a vectorized predicate."""
+
+    def __init__(self, name, expression, metric_names):
+        self.name = name
+        self.expression = expression
+        tree = ast.parse(expression, mode="eval")
+        for node in ast.walk(tree):
+            if not isinstance(node, _ALLOWED):
+                raise ValueError(f"Screen '{name}': unsupported syntax {type(node).__name__} in {expression!r}")
+            if isinstance(node, ast.Name) and node.id not in metric_names:
+                raise ValueError(f"Screen '{name}': unknown metric '{node.id}' (available: {sorted(metric_names)})")
+            if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float, bool)):
+                raise ValueError(f"Screen '{name}': only numeric constants are allowed in {expression!r}")
+        self.names = sorted({node.id for node in ast.walk(tree) if isinstance(node, ast.Name)})
+        tree = ast.fix_missing_locations(_Vectorize().visit(tree))
+        self._code = compile(tree, f"<screen {name}>", "eval")
+
+    def evaluate(self, columns):
+        """
+        Boolean mask over all symbols. A comparison with a NaN metric is unknown rather than
+        False, and a symbol passes only if the whole expression is known to be true.
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = eval(self._code, dict(_HELPERS), {n: columns[n] for n in self.names})
+        return np.broadcast_to(_truth(result) == 1, len(next(iter(columns.values()))))
+
+
+def load_screens(path):
+    """Reads {"screens": {name: expression, ...}} (plus an optional "years") from a JSON file."""
+    with open(path, encoding="utf-8") as f:
+        config = json.load(f)
+    return config["screens"], config.get("years")
+
+
+def compile_screens(screens, metric_names):
+    return [Screen(name, expression, set(metric_names)) for name, expression in screens.items()]
+
+
+def run_screens(screens, metrics):
+    """
+    Evaluates every screen against one shared metric table (symbols x metrics), e.g. from
+    nse_panel.compute_metrics. Returns a symbols x screens boolean DataFrame.
+    """
+    compiled = compile_screens(screens, metrics.columns) if isinstance(screens, dict) else screens
+    columns = {name: metrics[name].to_numpy() for name in metrics.columns}
+    return pd.DataFrame({screen.name: screen.evaluate(columns) for screen in compiled}, index=metrics.index)
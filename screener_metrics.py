@@ -0,0 +1,157 @@
+import functools
+import json
+import math
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+# Latency histogram buckets: powers of two in microseconds, 1us .. ~134s.
+_BUCKETS = 28
+
+
+class LatencyHistogram:
+    """Log2-bucketed latency histogram; cheap to update, good enough for p50/p95 at a glance."""
+
+    def __init__(self):
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, seconds):
+        micros = seconds * 1e6
+        bucket = 0 if micros < 1 else min(_BUCKETS - 1, int(math.log2(micros)) + 1)
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total += seconds
+
+    def percentile(self, q):
+        """Upper bound (in seconds) of the bucket holding the q-th percentile."""
+        if not self.count:
+            return 0.0
+        target = q / 100 * self.count
+        seen = 0
+        for bucket, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return (2 ** bucket) / 1e6
+        return (2 ** (_BUCKETS - 1)) / 1e6
+
+
+class ScreenerMetrics:
+    """
+    Counters, latency histograms and events for a screening run.
+
+    report() replaces the criteria's per-rejection prints: it always counts the reason, but
+    only formats the message when it will be shown (not quiet) or logged (a JSON-lines
+    `sink` is attached), so quiet runs pay for a counter increment and nothing else.
+    Each rejected symbol gets exactly one report(); intermediate notes on the way to it (e.g.
+    why ROE couldn't be computed) go through diagnose() and are counted separately.
+    """
+
+    def __init__(self, quiet=False, sink=None):
+        self.quiet = quiet
+        self.sink = sink
+        self.reasons = Counter()    # (stage, reason) -> count, one per rejection
+        self.diagnostics = Counter()  # (stage, reason) -> count, notes that precede a rejection
+        self.outcomes = Counter()   # (criterion, "pass"/"fail") -> count
+        self.timings = defaultdict(LatencyHistogram)
+        self._lock = threading.Lock()
+
+    def report(self, symbol, stage, reason, message, *args):
+        with self._lock:
+            self.reasons[(stage, reason)] += 1
+        self._emit("reject", symbol, stage, reason, message, args)
+
+    def diagnose(self, symbol, stage, reason, message, *args):
+        """Like report(), but for a note that isn't itself the rejection reason."""
+        with self._lock:
+            self.diagnostics[(stage, reason)] += 1
+        self._emit("diagnostic", symbol, stage, reason, message, args)
+
+    def _emit(self, kind, symbol, stage, reason, message, args):
+        if self.quiet and self.sink is None:
+            return
+        text = message.format(*args) if args else message
+        if not self.quiet:
+            print(f"  - {symbol} | {stage}: {text}")
+        self.event(kind, symbol=symbol, stage=stage, reason=reason, message=text)
+
+    def log(self, message, *args):
+        """Progress lines; skipped entirely in quiet mode."""
+        if not self.quiet:
+            print(message.format(*args) if args else message)
+
+    def event(self, kind, **fields):
+        if self.sink is None:
+            return
+        line = json.dumps({"event": kind, "ts": time.time(), **fields}, default=str)
+        with self._lock:
+            self.sink.write(line + "\n")
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            self.timings[stage].add(seconds)
+
+    def outcome(self, criterion, passed):
+        with self._lock:
+            self.outcomes[(criterion, "pass" if passed else "fail")] += 1
+
+    @contextmanager
+    def timer(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def summary(self):
+        lines = ["Run summary", "-" * 30, "Time by stage:"]
+        total = sum(h.total for h in self.timings.values()) or 1.0
+        for stage, h in sorted(self.timings.items(), key=lambda kv: -kv[1].total):
+            lines.append(f"  {stage:<24} {h.total:9.3f}s {h.total / total:6.1%}  n={h.count:<6} "
+                         f"mean {h.total / h.count * 1e3:8.3f}ms  p50<{h.percentile(50) * 1e3:.3f}ms  "
+                         f"p95<{h.percentile(95) * 1e3:.3f}ms")
+        criteria = sorted({c for c, _ in self.outcomes})
+        if criteria:
+            lines.append("Criteria:")
+            for c in criteria:
+                lines.append(f"  {c:<24} passed {self.outcomes[(c, 'pass')]:<6} rejected {self.outcomes[(c, 'fail')]}")
+        if self.reasons:
+            lines.append("Rejection reasons:")
+            for (stage, reason), n in self.reasons.most_common():
+                lines.append(f"  {stage + ': ' + reason:<40} {n}")
+        if self.diagnostics:
+            lines.append("Diagnostics (not counted as rejections):")
+            for (stage, reason), n in self.diagnostics.most_common():
+                lines.append(f"  {stage + ': ' + reason:<40} {n}")
+        return "\n".join(lines)
+
+
+# The metrics every screening function reports to; replace with set_metrics for a run.
+_metrics = ScreenerMetrics()
+
+
+def get_metrics():
+    return _metrics
+
+
+def set_metrics(metrics):
+    global _metrics
+    _metrics = metrics
+    return metrics
+
+
+def timed_criterion(name):
+    """Decorator: times a criterion (compute only, its inputs are already loaded) and counts pass/fail."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            metrics = _metrics
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            metrics.observe(f"check.{name}", time.perf_counter() - start)
+            metrics.outcome(name, bool(result))
+            return result
+        return wrapper
+    return decorate
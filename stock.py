@@ -1,44 +1,62 @@
+import argparse
+import numpy as np
 import pandas as pd
-import yfinance as yf
 import requests
 import time
-import io
 from tqdm import tqdm
+from data_providers import get_provider
+from price_store import PriceStore
+from nse_universe import equity_symbols
 
 # Configure settings
 requests.packages.urllib3.disable_warnings()
 
+GROWTH_PERIOD = "6mo"
+MIN_ROWS = 60            # Bars needed for a symbol to count
+MIN_PRICE = 10           # Start and end price must both be above this
+MIN_AVG_VOLUME = 100000
+MIN_GROWTH_PCT = 100     # i.e. the price doubled
+BATCH_SIZE = 200         # Tickers per multi-ticker yf.download call in batched mode
+
+# Momentum scan: calendar windows ending at the latest bar, and the history to download for them
+MOMENTUM_WINDOWS = {
+    "1w": pd.DateOffset(weeks=1),
+    "1m": pd.DateOffset(months=1),
+    "3m": pd.DateOffset(months=3),
+    "6m": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+}
+MOMENTUM_PERIOD = "1y"
+MOMENTUM_THRESHOLDS = (10, 25, 50, 100)  # Growth % flags added to every window's table
+
 def get_nse_stocks():
     """Fetch list of all NSE-listed stocks"""
     try:
-        url = "https://archives.nseindia.com/content/equities/EQUITY_L.csv"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Referer': 'https://www.nseindia.com/'
-        }
-        
-        session = requests.Session()
-        response = session.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        df = pd.read_csv(
-            io.StringIO(response.text),
-            dtype={'SYMBOL': str},
-            usecols=['SYMBOL'],
-            on_bad_lines='skip'
-        )
-        
-        print(f"Successfully fetched {len(df)} NSE stocks")
-        return df['SYMBOL'].unique().tolist()
+        symbols = equity_symbols()
+        print(f"Successfully fetched {len(symbols)} NSE stocks")
+        return list(dict.fromkeys(symbols))
     
     except Exception as e:
         print(f"Failed to fetch NSE list: {str(e)}")
         return []
 
-def analyze_growth():
-    symbols = get_nse_stocks()
+def analyze_growth(symbols=None, pause=0.15, batch_size=None, store=None):
+    """
+    Finds stocks whose price at least doubled over the last 6 months.
+    `symbols` defaults to the full NSE list; `pause` is the sleep between downloads.
+    With a `batch_size`, tickers are downloaded `batch_size` at a time in one multi-ticker
+    call each and screened with whole-frame operations (see growth_table).
+    With a PriceStore, only bars newer than what the store holds are downloaded and the
+    scan reads the window from disk.
+    """
+    if symbols is None:
+        symbols = get_nse_stocks()
     if not symbols:
         return []
+    if store is not None:
+        return _analyze_growth_from_store(symbols, store, batch_size or BATCH_SIZE)
+    if batch_size:
+        return _analyze_growth_batched(symbols, pause, batch_size)
     
     doubled_stocks = []
     
@@ -47,24 +65,24 @@ def analyze_growth():
     for symbol in tqdm(symbols, desc="Processing Stocks"):
         try:
             yf_symbol = f"{symbol}.NS"
-            data = yf.download(yf_symbol, period="6mo", progress=False, threads=True)
+            data = get_provider().download(yf_symbol, period=GROWTH_PERIOD, progress=False, threads=True)
             
-            if len(data) < 60:
+            if len(data) < MIN_ROWS:
                 continue
                 
             start_price = data['Adj Close'].iloc[0]
             end_price = data['Adj Close'].iloc[-1]
             
-            if start_price <= 10 or end_price <= 10:
+            if start_price <= MIN_PRICE or end_price <= MIN_PRICE:
                 continue
                 
             current_volume = data['Volume'].mean()
-            if current_volume < 100000:
+            if current_volume < MIN_AVG_VOLUME:
                 continue
                 
             growth = ((end_price - start_price)/start_price)*100
             
-            if growth >= 100:
+            if growth >= MIN_GROWTH_PCT:
                 doubled_stocks.append({
                     'Symbol': yf_symbol,
                     'Start Price': round(start_price, 2),
@@ -73,22 +91,213 @@ def analyze_growth():
                     '3M Avg Volume': f"{current_volume:,.0f}"
                 })
             
-            time.sleep(0.15)
+            time.sleep(pause)
             
         except Exception as e:  # Properly indented except block
             continue
     
     return doubled_stocks  # Now correctly aligned
 
+def growth_table(prices, volumes):
+    """
+    Vectorized growth scan over wide frames (dates x tickers) of adjusted closes and volumes.
+    Returns one row per ticker with rows, start/end price, mean volume, growth % and whether it
+    passes the same filters as the per-symbol loop in analyze_growth.
+    """
+    values = prices.to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    rows = valid.sum(axis=0)
+    cols = np.arange(values.shape[1])
+    # First and last non-NaN bar per ticker (tickers listed mid-window start later).
+    first = valid.argmax(axis=0)
+    last = values.shape[0] - 1 - valid[::-1].argmax(axis=0)
+    start_price = np.where(rows > 0, values[first, cols], np.nan)
+    end_price = np.where(rows > 0, values[last, cols], np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_volume = volumes.mean(axis=0).to_numpy(dtype=float)
+        growth = (end_price - start_price) / start_price * 100
+
+    passed = ((rows >= MIN_ROWS) & (start_price > MIN_PRICE) & (end_price > MIN_PRICE)
+              & (avg_volume >= MIN_AVG_VOLUME) & (growth >= MIN_GROWTH_PCT))
+    return pd.DataFrame({
+        "rows": rows,
+        "start_price": start_price,
+        "end_price": end_price,
+        "avg_volume": avg_volume,
+        "growth_pct": growth,
+        "passed": passed,
+    }, index=prices.columns)
+
+def _prefix(values):
+    """Cumulative sums with a leading zero row, so any window's total is one subtraction."""
+    out = np.zeros((values.shape[0] + 1,) + values.shape[1:])
+    np.cumsum(values, axis=0, out=out[1:])
+    return out
+
+def momentum_scan(prices, volumes, windows=MOMENTUM_WINDOWS, thresholds=MOMENTUM_THRESHOLDS):
+    """
+    Growth, average volume and max drawdown for every ticker over every window at once, from
+    wide (dates x tickers) price and volume frames covering the longest window.
+    Each window is the bars after (latest date - offset), as with yf.download's period, so the
+    "6m" row for a ticker matches growth_table on a 6mo download.
+
+    Everything is computed from one price/volume matrix: prefix sums of bar and volume counts
+    make each window's row count and mean volume a subtraction, the start/end prices come from
+    back/forward-filled copies, and only the drawdown walks the window's rows.
+    Returns {window: DataFrame of the eligible tickers ranked by growth}.
+    """
+    values = prices.to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    vol = volumes.reindex(index=prices.index, columns=prices.columns).to_numpy(dtype=float)
+    vol_valid = ~np.isnan(vol)
+    bar_count = _prefix(valid)
+    vol_sum = _prefix(np.where(vol_valid, vol, 0.0))
+    vol_count = _prefix(vol_valid)
+    filled = prices.ffill().to_numpy(dtype=float)   # last price at or before each bar
+    backfilled = prices.bfill().to_numpy(dtype=float)  # first price at or after each bar
+    end_price = filled[-1] if len(values) else np.full(values.shape[1], np.nan)
+    end = len(values)
+
+    tables = {}
+    for name, offset in windows.items():
+        first = int(np.searchsorted(prices.index, prices.index[-1] - offset, side="right")) if end else 0
+        rows = bar_count[end] - bar_count[first]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            start_price = backfilled[first] if first < end else np.full(values.shape[1], np.nan)
+            growth = (end_price - start_price) / start_price * 100
+            avg_volume = (vol_sum[end] - vol_sum[first]) / (vol_count[end] - vol_count[first])
+            window = filled[first:]
+            drawdown = np.nanmin(window / np.fmax.accumulate(window, axis=0) - 1, axis=0, initial=0.0) * 100
+
+        # Same filters as growth_table; the bar requirement shrinks for windows shorter than MIN_ROWS.
+        eligible = ((rows >= min(MIN_ROWS, end - first)) & (rows > 0) & (start_price > MIN_PRICE)
+                    & (end_price > MIN_PRICE) & (avg_volume >= MIN_AVG_VOLUME))
+        table = pd.DataFrame({
+            "rows": rows.astype(np.int64),
+            "start_price": start_price,
+            "end_price": end_price,
+            "growth_pct": growth,
+            "avg_volume": avg_volume,
+            "max_drawdown_pct": drawdown,
+        }, index=prices.columns)[eligible]
+        for threshold in thresholds:
+            table[f">={threshold}%"] = table["growth_pct"].to_numpy() >= threshold
+        table = table.sort_values("growth_pct", ascending=False, kind="stable")
+        table.insert(0, "rank", np.arange(1, len(table) + 1))
+        tables[name] = table
+    return tables
+
+def _momentum_frames(symbols, batch_size, store=None):
+    """Wide price and volume frames for MOMENTUM_PERIOD, from the store or batched downloads."""
+    yf_symbols = [f"{symbol}.NS" for symbol in symbols]
+    if store is not None:
+        store.update(yf_symbols, period=MOMENTUM_PERIOD, batch_size=batch_size)
+        return store.period_frames(yf_symbols, MOMENTUM_PERIOD)
+    prices, volumes = [], []
+    for i in tqdm(range(0, len(yf_symbols), batch_size), desc="Downloading Batches"):
+        chunk = yf_symbols[i:i + batch_size]
+        try:
+            data = get_provider().download(chunk, period=MOMENTUM_PERIOD, progress=False, threads=True,
+                                           auto_adjust=False, group_by="column")
+        except Exception:
+            continue
+        if data is None or data.empty:
+            continue
+        chunk_prices, chunk_volumes = _split_fields(data, chunk)
+        prices.append(chunk_prices)
+        volumes.append(chunk_volumes)
+    if not prices:
+        return pd.DataFrame(), pd.DataFrame()
+    return pd.concat(prices, axis=1).sort_index(), pd.concat(volumes, axis=1).sort_index()
+
+def scan_momentum(symbols=None, batch_size=BATCH_SIZE, store=None, windows=MOMENTUM_WINDOWS):
+    """Downloads (or reads) one year of bars for every symbol once and runs momentum_scan on it."""
+    if symbols is None:
+        symbols = get_nse_stocks()
+    if not symbols:
+        return {}
+    prices, volumes = _momentum_frames(symbols, batch_size or BATCH_SIZE, store)
+    if prices.empty:
+        return {}
+    return momentum_scan(prices, volumes, windows)
+
+def _split_fields(data, tickers):
+    """Returns (adjusted closes, volumes) as dates x tickers frames from a yf.download result."""
+    if not isinstance(data.columns, pd.MultiIndex):
+        # A single ticker may come back with flat columns.
+        data = pd.concat({tickers[0]: data}, axis=1).swaplevel(0, 1, axis=1)
+    fields = data.columns.get_level_values(0)
+    price_field = 'Adj Close' if 'Adj Close' in fields else 'Close'
+    prices = data[price_field].reindex(columns=tickers)
+    volumes = data['Volume'].reindex(columns=tickers)
+    return prices, volumes
+
+def _doubled_rows(table):
+    return [{
+        'Symbol': yf_symbol,
+        'Start Price': round(row['start_price'], 2),
+        'End Price': round(row['end_price'], 2),
+        'Growth %': round(row['growth_pct'], 2),
+        '3M Avg Volume': f"{row['avg_volume']:,.0f}"
+    } for yf_symbol, row in table[table["passed"]].iterrows()]
+
+def _analyze_growth_from_store(symbols, store, batch_size):
+    yf_symbols = [f"{symbol}.NS" for symbol in symbols]
+    print(f"\nUpdating price store '{store.root}' for {len(yf_symbols)} symbols...")
+    downloaded = store.update(yf_symbols, batch_size=batch_size)
+    print(f"Downloaded {downloaded} new bars; analyzing from the store...")
+    prices, volumes = store.period_frames(yf_symbols, GROWTH_PERIOD)
+    return _doubled_rows(growth_table(prices, volumes))
+
+def _analyze_growth_batched(symbols, pause, batch_size):
+    doubled_stocks = []
+    yf_symbols = [f"{symbol}.NS" for symbol in symbols]
+    chunks = [yf_symbols[i:i + batch_size] for i in range(0, len(yf_symbols), batch_size)]
+
+    print(f"\nAnalyzing all {len(symbols)} symbols in {len(chunks)} batches of up to {batch_size}...")
+
+    for chunk in tqdm(chunks, desc="Processing Batches"):
+        try:
+            data = get_provider().download(chunk, period=GROWTH_PERIOD, progress=False, threads=True,
+                                           auto_adjust=False, group_by="column")
+        except Exception:
+            continue
+        if data is None or data.empty:
+            continue
+
+        doubled_stocks.extend(_doubled_rows(growth_table(*_split_fields(data, chunk))))
+        time.sleep(pause)
+
+    return doubled_stocks
+
 if __name__ == "__main__":
-    print("Starting comprehensive analysis...")
-    results = analyze_growth()
-    
-    if results:
-        df = pd.DataFrame(results)
-        df = df.sort_values('Growth %', ascending=False)
-        df.to_csv('all_doubled_stocks.csv', index=False)
-        print(f"\nFound {len(results)} stocks that doubled:")
-        print(df[['Symbol', 'Growth %', 'Start Price', 'End Price', '3M Avg Volume']].to_string(index=False))
+    parser = argparse.ArgumentParser(description="Find NSE stocks that doubled over the last 6 months")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help="tickers per multi-ticker download (0 = one download per symbol)")
+    parser.add_argument("--store", metavar="DIR", help="keep prices in a local store and only download new bars")
+    parser.add_argument("--momentum", action="store_true",
+                        help=f"rank growth/volume/drawdown over {', '.join(MOMENTUM_WINDOWS)} instead")
+    parser.add_argument("--top", type=int, default=20, help="rows to print per window with --momentum")
+    args = parser.parse_args()
+
+    if args.momentum:
+        print("Starting momentum scan...")
+        tables = scan_momentum(batch_size=args.batch_size, store=PriceStore(args.store) if args.store else None)
+        for name, table in tables.items():
+            table.to_csv(f"momentum_{name}.csv", index_label="Symbol")
+            print(f"\n--- {name}: {len(table)} eligible stocks, top {min(args.top, len(table))} by growth ---")
+            print(table.head(args.top).round(2).to_string())
+        if not tables:
+            print("\nNo price data available for the momentum scan")
     else:
-        print("\nNo doubling stocks found in the analysis")
\ No newline at end of file
+        print("Starting comprehensive analysis...")
+        results = analyze_growth(batch_size=args.batch_size, store=PriceStore(args.store) if args.store else None)
+    
+        if results:
+            df = pd.DataFrame(results)
+            df = df.sort_values('Growth %', ascending=False)
+            df.to_csv('all_doubled_stocks.csv', index=False)
+            print(f"\nFound {len(results)} stocks that doubled:")
+            print(df[['Symbol', 'Growth %', 'Start Price', 'End Price', '3M Avg Volume']].to_string(index=False))
+        else:
+            print("\nNo doubling stocks found in the analysis")
\ No newline at end of file